@@ -3,9 +3,25 @@ Lógica del juego Sudoku: validación, puntuación y control de estado
 """
 
 import time
+from array import array
 from typing import List, Tuple, Optional
-from datetime import datetime
 import os
+from operator import eq
+
+from sudoku_numba import NUMBA_AVAILABLE, STATUS_NAMES, classify_cells, np
+
+
+# Nombre del archivo de estadísticas
+STATS_FILENAME = "estadisticas_sudoku.txt"
+
+# Separadores y encabezado del archivo de estadísticas (se construyen una sola vez)
+SECTION_RULE = "─" * 70 + "\n"
+GAME_SEPARATOR = "\n" + "=" * 70 + "\n\n"
+STATS_HEADER = (
+    "╔════════════════════════════════════════════════════════════════════╗\n"
+    "║           ESTADÍSTICAS DE PARTIDA - SUDOKU COGNITIVO               ║\n"
+    "╚════════════════════════════════════════════════════════════════════╝\n\n"
+)
 
 
 class SudokuGame:
@@ -18,18 +34,29 @@ class SudokuGame:
     Atributos:
         size (int): Tamaño del tablero (9x9)
         box_size (int): Tamaño de subcuadro (3x3)
-        puzzle (List[List[int]]): Tablero inicial con celdas vacías
-        solution (List[List[int]]): Solución correcta del tablero
-        current_board (List[List[int]]): Estado actual del tablero
+        puzzle (Tuple[Tuple[int, ...], ...]): Tablero inicial con celdas vacías (inmutable)
+        solution (Tuple[Tuple[int, ...], ...]): Solución correcta del tablero (inmutable)
+        current_board (bytearray): Estado actual del tablero, plano de 81 bytes
+                                   (celda (row, col) en el índice row*9 + col)
         difficulty (str): Nivel de dificultad seleccionado
-        fixed_cells (set): Conjunto de posiciones de celdas fijas (no editables)
-        start_time (float): Timestamp del inicio del juego
+        fixed_cells (frozenset): Conjunto de posiciones de celdas fijas (no editables)
+        start_time (float): Instante de inicio del juego (reloj monotónico)
         errors_count (int): Contador de errores cometidos
         helps_used (int): Contador de ayudas utilizadas
         is_finished (bool): Indica si el juego ha terminado
-        time_limits (dict): Límites de tiempo por dificultad en segundos
+        time_limit (int): Límite de tiempo de la partida en segundos
+        row_mask (array): Máscara de bits por fila (bit k = dígito k+1 presente)
+        col_mask (array): Máscara de bits por columna
+        box_mask (array): Máscara de bits por subcuadro 3x3
     """
 
+    # Límites de tiempo por dificultad (en segundos), compartidos por todas las partidas
+    _TIME_LIMITS = {
+        'Fácil': 1800,    # 30 minutos
+        'Medio': 2400,    # 40 minutos
+        'Difícil': 3000   # 50 minutos
+    }
+
     def __init__(self, puzzle: List[List[int]], solution: List[List[int]], difficulty: str):
         """
         Inicializa el juego
@@ -44,42 +71,166 @@ class SudokuGame:
         """
         self.size = 9
         self.box_size = 3
-        self.puzzle = [row[:] for row in puzzle]
-        self.solution = [row[:] for row in solution]
-        self.current_board = [row[:] for row in puzzle]
+        # Tablero inicial y solución son de solo lectura: se guardan como
+        # tuplas inmutables y en forma plana, sin copias de listas
+        self.puzzle = tuple(tuple(row) for row in puzzle)
+        self.solution = tuple(tuple(row) for row in solution)
+        self._puzzle_bytes = bytes(v for row in self.puzzle for v in row)
+        self._solution_bytes = bytes(v for row in self.solution for v in row)
+        self.current_board = bytearray(self._puzzle_bytes)
+
+        # Vistas NumPy sin copia sobre los tableros planos para los núcleos
+        # compilados con Numba (solo si está instalado)
+        if NUMBA_AVAILABLE:
+            self._current_np = np.frombuffer(self.current_board, dtype=np.uint8)
+            self._solution_np = np.frombuffer(self._solution_bytes, dtype=np.uint8)
+            self._puzzle_np = np.frombuffer(self._puzzle_bytes, dtype=np.uint8)
+            self._status_np = np.empty(81, dtype=np.uint8)
+
         self.difficulty = difficulty
         self.fixed_cells = self._get_fixed_cells()
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.errors_count = 0
         self.helps_used = 0
         self.is_finished = False
+        self._build_masks()
 
-        # Límites de tiempo por dificultad (en segundos)
-        self.time_limits = {
-            'Fácil': 1800,    # 30 minutos
-            'Medio': 2400,    # 40 minutos
-            'Difícil': 3000   # 50 minutos
-        }
+        # Ruta absoluta del archivo de estadísticas (resuelta una sola vez)
+        self._stats_path = os.path.abspath(STATS_FILENAME)
+
+        # Límite de tiempo de esta partida (en segundos)
+        self.time_limit = SudokuGame._TIME_LIMITS.get(difficulty, 2400)
 
-    def _get_fixed_cells(self) -> set:
+    def _get_fixed_cells(self) -> frozenset:
         """
         Obtiene las posiciones de las celdas fijas (no editables)
 
         Recorre el tablero inicial y marca todas las celdas que
         ya tienen un valor como fijas (no editables por el jugador).
+        Además guarda en `self._fixed_bits` un entero de 81 bits donde
+        el bit row*9 + col está encendido si la celda es fija.
 
         Args:
             Ninguno
 
         Returns:
-            set: Conjunto de tuplas (row, col) con las posiciones fijas
+            frozenset: Conjunto de tuplas (row, col) con las posiciones fijas
         """
         fixed = set()
+        bits = 0
         for row in range(self.size):
             for col in range(self.size):
                 if self.puzzle[row][col] != 0:
                     fixed.add((row, col))
-        return fixed
+                    bits |= 1 << (row * 9 + col)
+        self._fixed_bits = bits
+        return frozenset(fixed)
+
+    def _build_masks(self):
+        """
+        Construye las máscaras de bits de filas, columnas y subcuadros
+
+        Cada máscara es un arreglo de 9 enteros de 16 bits donde el bit k
+        indica que el dígito k+1 está presente en esa unidad. Como el jugador
+        puede repetir dígitos, se lleva además un conteo por unidad y dígito
+        para saber cuándo apagar un bit al borrar una celda.
+
+        Args:
+            Ninguno
+
+        Returns:
+            None
+        """
+        self.row_mask = array('H', [0] * self.size)
+        self.col_mask = array('H', [0] * self.size)
+        self.box_mask = array('H', [0] * self.size)
+
+        # Conteos indexados por unidad * 9 + (dígito - 1)
+        self._row_counts = array('B', [0] * (self.size * 9))
+        self._col_counts = array('B', [0] * (self.size * 9))
+        self._box_counts = array('B', [0] * (self.size * 9))
+
+        for row in range(self.size):
+            for col in range(self.size):
+                value = self.current_board[row * 9 + col]
+                if value != 0:
+                    self._add_digit(row, col, value)
+
+    def _add_digit(self, row: int, col: int, num: int):
+        """
+        Registra un dígito en las máscaras de su fila, columna y subcuadro
+
+        Args:
+            row (int): Fila (0-8)
+            col (int): Columna (0-8)
+            num (int): Dígito colocado (1-9)
+
+        Returns:
+            None
+        """
+        bit = 1 << (num - 1)
+        box = (row // self.box_size) * self.box_size + col // self.box_size
+
+        self._row_counts[row * 9 + num - 1] += 1
+        self._col_counts[col * 9 + num - 1] += 1
+        self._box_counts[box * 9 + num - 1] += 1
+
+        self.row_mask[row] |= bit
+        self.col_mask[col] |= bit
+        self.box_mask[box] |= bit
+
+    def _remove_digit(self, row: int, col: int, num: int):
+        """
+        Retira un dígito de las máscaras de su fila, columna y subcuadro
+
+        El bit solo se apaga cuando ya no queda otra celda de la unidad
+        con el mismo dígito.
+
+        Args:
+            row (int): Fila (0-8)
+            col (int): Columna (0-8)
+            num (int): Dígito retirado (1-9)
+
+        Returns:
+            None
+        """
+        bit = 1 << (num - 1)
+        box = (row // self.box_size) * self.box_size + col // self.box_size
+
+        self._row_counts[row * 9 + num - 1] -= 1
+        self._col_counts[col * 9 + num - 1] -= 1
+        self._box_counts[box * 9 + num - 1] -= 1
+
+        if not self._row_counts[row * 9 + num - 1]:
+            self.row_mask[row] &= ~bit
+        if not self._col_counts[col * 9 + num - 1]:
+            self.col_mask[col] &= ~bit
+        if not self._box_counts[box * 9 + num - 1]:
+            self.box_mask[box] &= ~bit
+
+    def _place(self, row: int, col: int, value: int):
+        """
+        Escribe un valor en el tablero manteniendo las máscaras sincronizadas
+
+        Args:
+            row (int): Fila (0-8)
+            col (int): Columna (0-8)
+            value (int): Valor a colocar (0-9, donde 0 borra la celda)
+
+        Returns:
+            None
+        """
+        idx = row * 9 + col
+        old = self.current_board[idx]
+        if old == value:
+            return
+
+        if old != 0:
+            self._remove_digit(row, col, old)
+        if value != 0:
+            self._add_digit(row, col, value)
+
+        self.current_board[idx] = value
 
     def is_cell_fixed(self, row: int, col: int) -> bool:
         """
@@ -92,7 +243,7 @@ class SudokuGame:
         Returns:
             bool: True si la celda es fija, False si es editable
         """
-        return (row, col) in self.fixed_cells
+        return (self._fixed_bits >> (row * 9 + col)) & 1 == 1
 
     def set_value(self, row: int, col: int, value: int) -> bool:
         """
@@ -112,7 +263,7 @@ class SudokuGame:
         if self.is_cell_fixed(row, col):
             return False
 
-        self.current_board[row][col] = value
+        self._place(row, col, value)
         return True
 
     def get_value(self, row: int, col: int) -> int:
@@ -126,7 +277,35 @@ class SudokuGame:
         Returns:
             int: Valor actual en la celda (0-9, donde 0 es vacío)
         """
-        return self.current_board[row][col]
+        return self.current_board[row * 9 + col]
+
+    def candidates(self, row: int, col: int) -> int:
+        """
+        Obtiene los dígitos permitidos en una celda como máscara de 9 bits
+
+        El bit k está encendido si el dígito k+1 no aparece en ninguna otra
+        celda de la fila, columna o subcuadro. El valor que ya tenga la
+        propia celda no cuenta como conflicto.
+
+        Args:
+            row (int): Fila (0-8)
+            col (int): Columna (0-8)
+
+        Returns:
+            int: Máscara de dígitos legales (0 a 0x1FF)
+        """
+        box = (row // self.box_size) * self.box_size + col // self.box_size
+        used = self.row_mask[row] | self.col_mask[col] | self.box_mask[box]
+
+        # El dígito de la propia celda solo bloquea si se repite en alguna unidad
+        current = self.current_board[row * 9 + col]
+        if current != 0:
+            if (self._row_counts[row * 9 + current - 1] == 1 and
+                    self._col_counts[col * 9 + current - 1] == 1 and
+                    self._box_counts[box * 9 + current - 1] == 1):
+                used &= ~(1 << (current - 1))
+
+        return ~used & 0x1FF
 
     def is_valid_move(self, row: int, col: int, num: int) -> bool:
         """
@@ -147,33 +326,7 @@ class SudokuGame:
         if num < 1 or num > 9:
             return False
 
-        # Crear tablero temporal con el número
-        temp_board = [row[:] for row in self.current_board]
-        temp_board[row][col] = num
-
-        # Verificar fila
-        if temp_board[row].count(num) > 1:
-            return False
-
-        # Verificar columna
-        col_values = [temp_board[r][col] for r in range(self.size) if temp_board[r][col] != 0]
-        if col_values.count(num) > 1:
-            return False
-
-        # Verificar subcuadro 3x3
-        start_row = (row // self.box_size) * self.box_size
-        start_col = (col // self.box_size) * self.box_size
-
-        box_values = []
-        for r in range(start_row, start_row + self.box_size):
-            for c in range(start_col, start_col + self.box_size):
-                if temp_board[r][c] != 0:
-                    box_values.append(temp_board[r][c])
-
-        if box_values.count(num) > 1:
-            return False
-
-        return True
+        return bool(self.candidates(row, col) & (1 << (num - 1)))
 
     def use_help(self, row: int, col: int) -> Optional[int]:
         """
@@ -195,7 +348,7 @@ class SudokuGame:
 
         self.helps_used += 1
         correct_value = self.solution[row][col]
-        self.current_board[row][col] = correct_value
+        self._place(row, col, correct_value)
         return correct_value
 
     def check_cell(self, row: int, col: int) -> str:
@@ -215,12 +368,12 @@ class SudokuGame:
         if self.is_cell_fixed(row, col):
             return 'fixed'
 
-        current = self.current_board[row][col]
+        current = self.current_board[row * 9 + col]
 
         if current == 0:
             return 'empty'
 
-        if current == self.solution[row][col]:
+        if current == self._solution_bytes[row * 9 + col]:
             return 'correct'
         else:
             return 'incorrect'
@@ -249,10 +402,33 @@ class SudokuGame:
             'fixed': []
         }
 
-        for row in range(self.size):
-            for col in range(self.size):
-                status = self.check_cell(row, col)
-                result[status].append((row, col))
+        if NUMBA_AVAILABLE:
+            # Clasificación en código compilado; aquí solo se arman las listas
+            status = self._status_np
+            classify_cells(self._current_np, self._solution_np, self._puzzle_np, status)
+            lists = [result[name] for name in STATUS_NAMES]
+            for idx, code in enumerate(status.tolist()):
+                lists[code].append(divmod(idx, 9))
+            return result
+
+        fixed_bits = self._fixed_bits
+        correct = result['correct']
+        incorrect = result['incorrect']
+        empty = result['empty']
+        fixed = result['fixed']
+
+        # Una sola pasada comparando tablero actual contra la solución,
+        # sin invocar check_cell por cada una de las 81 celdas
+        for idx, (current, expected) in enumerate(zip(self.current_board, self._solution_bytes)):
+            row, col = divmod(idx, 9)
+            if (fixed_bits >> idx) & 1:
+                fixed.append((row, col))
+            elif current == 0:
+                empty.append((row, col))
+            elif current == expected:
+                correct.append((row, col))
+            else:
+                incorrect.append((row, col))
 
         return result
 
@@ -260,8 +436,8 @@ class SudokuGame:
         """
         Verifica si el tablero está completamente lleno
 
-        Recorre todas las celdas para verificar que no haya
-        ninguna vacía (valor 0).
+        Busca un cero en el tablero plano; la búsqueda con `in` sobre un
+        bytearray se resuelve en C (memchr) sin iterar en Python.
 
         Args:
             Ninguno
@@ -269,18 +445,15 @@ class SudokuGame:
         Returns:
             bool: True si todas las celdas están llenas, False si hay al menos una vacía
         """
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.current_board[row][col] == 0:
-                    return False
-        return True
+        return 0 not in self.current_board
 
     def is_correct(self) -> bool:
         """
         Verifica si el tablero está correcto y completo
 
-        Comprueba que el tablero esté lleno y que todos los valores
-        coincidan con la solución.
+        Compara el tablero plano contra la solución en una sola operación.
+        Como la solución no contiene ceros, la igualdad implica que el
+        tablero también está lleno.
 
         Args:
             Ninguno
@@ -288,17 +461,84 @@ class SudokuGame:
         Returns:
             bool: True si el tablero está completamente correcto, False en caso contrario
         """
-        if not self.is_complete():
-            return False
+        return self.current_board == self._solution_bytes
 
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.current_board[row][col] != self.solution[row][col]:
-                    return False
+    def _tally_counts(self) -> Tuple[int, int, int]:
+        """
+        Cuenta las celdas incorrectas, vacías y correctas sin crear listas
 
-        return True
+        Las celdas fijas nunca están vacías y siempre coinciden con la
+        solución, por lo que basta contar ceros y coincidencias sobre el
+        tablero plano (ambas operaciones se resuelven en C) y descontar
+        las celdas fijas.
+
+        Args:
+            Ninguno
+
+        Returns:
+            Tuple[int, int, int]: (incorrectas, vacías, correctas) entre las
+                celdas editables
+        """
+        if NUMBA_AVAILABLE:
+            correct, incorrect, empty, _ = classify_cells(
+                self._current_np, self._solution_np, self._puzzle_np, self._status_np)
+            return incorrect, empty, correct
+
+        fixed_count = len(self.fixed_cells)
+        empty = self.current_board.count(0)
+        correct = sum(map(eq, self.current_board, self._solution_bytes)) - fixed_count
+        incorrect = self.size * self.size - fixed_count - empty - correct
+        return incorrect, empty, correct
+
+    def _score_breakdown(self, incorrect_count: int, empty_count: int,
+                         elapsed_time: float) -> Tuple[int, int, int, int]:
+        """
+        Calcula la puntuación a partir de los conteos de celdas
+
+        Args:
+            incorrect_count (int): Cantidad de celdas incorrectas
+            empty_count (int): Cantidad de celdas vacías
+            elapsed_time (float): Tiempo transcurrido en segundos
+
+        Returns:
+            Tuple[int, int, int, int]: (puntuación final, bonificación por tiempo,
+                penalización por errores, penalización por ayudas)
+        """
+        base_score = 1000
+        time_remaining = max(0, self.time_limit - elapsed_time)
+
+        # Bonificación por tiempo: +1 punto por cada 5 segundos restantes
+        time_bonus = int(time_remaining / 5)
+
+        # Penalizaciones
+        error_penalty = incorrect_count * 5
+        help_penalty = self.helps_used * 10
+        empty_penalty = empty_count * 3
+
+        # Puntuación final
+        final_score = base_score + time_bonus - error_penalty - help_penalty - empty_penalty
+        final_score = max(0, final_score)  # No negativo
 
-    def finish_game(self) -> dict:
+        return final_score, time_bonus, error_penalty, help_penalty
+
+    def compute_score(self) -> int:
+        """
+        Calcula la puntuación actual sin finalizar el juego
+
+        Versión ligera de finish_game() pensada para vistas previas durante
+        la partida: trabaja solo con conteos y no arma las listas de
+        posiciones por estado.
+
+        Args:
+            Ninguno
+
+        Returns:
+            int: Puntuación que se obtendría si el juego terminara ahora
+        """
+        incorrect_count, empty_count, _ = self._tally_counts()
+        return self._score_breakdown(incorrect_count, empty_count, self.get_elapsed_time())[0]
+
+    def finish_game(self, cell_status: Optional[dict] = None) -> dict:
         """
         Finaliza el juego y calcula la puntuación
 
@@ -308,7 +548,8 @@ class SudokuGame:
         - Penalizaciones: -5 por error, -10 por ayuda, -3 por celda vacía
 
         Args:
-            Ninguno
+            cell_status (Optional[dict]): Resultado de check_all_cells() ya
+                calculado para el tablero actual. Si es None se calcula aquí.
 
         Returns:
             dict: Diccionario con información del resultado:
@@ -324,29 +565,21 @@ class SudokuGame:
                 - 'cell_status' (dict): Estado de todas las celdas
         """
         self.is_finished = True
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = self.get_elapsed_time()
 
         # Verificar estado del tablero
-        cell_status = self.check_all_cells()
+        if cell_status is None:
+            cell_status = self.check_all_cells()
         incorrect_count = len(cell_status['incorrect'])
         empty_count = len(cell_status['empty'])
 
-        # Calcular puntuación
-        base_score = 1000
-        time_limit = self.time_limits.get(self.difficulty, 2400)
-        time_remaining = max(0, time_limit - elapsed_time)
+        # Las celdas fijas siempre son correctas, así que el tablero es
+        # correcto si no quedan celdas incorrectas ni vacías
+        is_correct = incorrect_count == 0 and empty_count == 0
 
-        # Bonificación por tiempo: +1 punto por cada 5 segundos restantes
-        time_bonus = int(time_remaining / 5)
-
-        # Penalizaciones
-        error_penalty = incorrect_count * 5
-        help_penalty = self.helps_used * 10
-        empty_penalty = empty_count * 3
-
-        # Puntuación final
-        final_score = base_score + time_bonus - error_penalty - help_penalty - empty_penalty
-        final_score = max(0, final_score)  # No negativo
+        # Calcular puntuación
+        final_score, time_bonus, error_penalty, help_penalty = self._score_breakdown(
+            incorrect_count, empty_count, elapsed_time)
 
         return {
             'score': final_score,
@@ -354,7 +587,7 @@ class SudokuGame:
             'errors': incorrect_count,
             'empty': empty_count,
             'helps': self.helps_used,
-            'correct': self.is_correct(),
+            'correct': is_correct,
             'time_bonus': time_bonus,
             'error_penalty': error_penalty,
             'help_penalty': help_penalty,
@@ -376,13 +609,10 @@ class SudokuGame:
         Returns:
             str: Ruta del archivo donde se guardaron las estadísticas
         """
-        # Nombre del archivo de estadísticas
-        filename = "estadisticas_sudoku.txt"
-
         # Obtener fecha y hora actual
-        now = datetime.now()
-        fecha = now.strftime("%d/%m/%Y")
-        hora = now.strftime("%H:%M:%S")
+        now = time.localtime()
+        fecha = time.strftime("%d/%m/%Y", now)
+        hora = time.strftime("%H:%M:%S", now)
 
         # Calcular tiempo en formato legible
         minutes = int(result['time'] // 60)
@@ -392,78 +622,77 @@ class SudokuGame:
         # Determinar si ganó o no
         estado = "COMPLETADO ✓" if result['correct'] else "INCOMPLETO ✗"
 
+        # Cálculo de porcentaje de completitud
+        total_celdas = 81
+        celdas_llenas = total_celdas - result['empty']
+        porcentaje_completitud = (celdas_llenas / total_celdas) * 100
+
+        # Cálculo de precisión (de las celdas llenas, cuántas son correctas)
+        celdas_correctas = len(result['cell_status']['correct'])
+        if celdas_llenas > 0:
+            porcentaje_precision = (celdas_correctas / celdas_llenas) * 100
+        else:
+            porcentaje_precision = 0
+
+        # Evaluación del desempeño
+        if result['correct']:
+            desempeño = "¡EXCELENTE! ⭐⭐⭐"
+        elif porcentaje_precision >= 90:
+            desempeño = "MUY BUENO ⭐⭐"
+        elif porcentaje_precision >= 70:
+            desempeño = "BUENO ⭐"
+        else:
+            desempeño = "NECESITA MEJORAR"
+
+        # Construir el registro completo en memoria para escribirlo de una vez
+        parts = [
+            STATS_HEADER,
+
+            # Información general
+            f"📅 Fecha: {fecha}\n",
+            f"🕐 Hora: {hora}\n",
+            f"📊 Dificultad: {self.difficulty}\n",
+            f"🎮 Estado: {estado}\n",
+            f"⏱️  Tiempo Total: {tiempo_formateado}\n\n",
+
+            # Puntuación
+            SECTION_RULE,
+            "🏆 PUNTUACIÓN\n",
+            SECTION_RULE,
+            f"   Puntuación Final: {result['score']} puntos\n",
+            "   Puntuación Base: 1000 puntos\n",
+            f"   Bonificación por tiempo: +{result['time_bonus']} puntos\n",
+            f"   Penalización por errores: -{result['error_penalty']} puntos\n",
+            f"   Penalización por ayudas: -{result['help_penalty']} puntos\n\n",
+
+            # Estadísticas detalladas
+            SECTION_RULE,
+            "📈 ESTADÍSTICAS DETALLADAS\n",
+            SECTION_RULE,
+            f"   ✅ Celdas correctas: {celdas_correctas}/81\n",
+            f"   ❌ Celdas incorrectas: {result['errors']}\n",
+            f"   ⬜ Celdas vacías: {result['empty']}\n",
+            f"   💡 Ayudas utilizadas: {result['helps']}\n\n",
+
+            # Análisis de desempeño
+            SECTION_RULE,
+            "📊 ANÁLISIS DE DESEMPEÑO\n",
+            SECTION_RULE,
+            f"   Completitud: {porcentaje_completitud:.1f}%\n",
+            f"   Precisión: {porcentaje_precision:.1f}%\n",
+            f"   Evaluación: {desempeño}\n\n",
+        ]
+
         try:
-            # Verificar si el archivo existe para agregar separador
-            file_exists = os.path.exists(filename)
-
-            # Abrir archivo en modo append (agregar al final)
-            with open(filename, 'a', encoding='utf-8') as file:
-                # Si el archivo ya existe, agregar separador
-                if file_exists:
-                    file.write("\n" + "="*70 + "\n\n")
-
-                # Escribir encabezado de la partida
-                file.write("╔════════════════════════════════════════════════════════════════════╗\n")
-                file.write("║           ESTADÍSTICAS DE PARTIDA - SUDOKU COGNITIVO               ║\n")
-                file.write("╚════════════════════════════════════════════════════════════════════╝\n\n")
-
-                # Información general
-                file.write(f"📅 Fecha: {fecha}\n")
-                file.write(f"🕐 Hora: {hora}\n")
-                file.write(f"📊 Dificultad: {self.difficulty}\n")
-                file.write(f"🎮 Estado: {estado}\n")
-                file.write(f"⏱️  Tiempo Total: {tiempo_formateado}\n\n")
-
-                # Puntuación
-                file.write("─" * 70 + "\n")
-                file.write("🏆 PUNTUACIÓN\n")
-                file.write("─" * 70 + "\n")
-                file.write(f"   Puntuación Final: {result['score']} puntos\n")
-                file.write(f"   Puntuación Base: 1000 puntos\n")
-                file.write(f"   Bonificación por tiempo: +{result['time_bonus']} puntos\n")
-                file.write(f"   Penalización por errores: -{result['error_penalty']} puntos\n")
-                file.write(f"   Penalización por ayudas: -{result['help_penalty']} puntos\n\n")
-
-                # Estadísticas detalladas
-                file.write("─" * 70 + "\n")
-                file.write("📈 ESTADÍSTICAS DETALLADAS\n")
-                file.write("─" * 70 + "\n")
-                file.write(f"   ✅ Celdas correctas: {len(result['cell_status']['correct'])}/81\n")
-                file.write(f"   ❌ Celdas incorrectas: {result['errors']}\n")
-                file.write(f"   ⬜ Celdas vacías: {result['empty']}\n")
-                file.write(f"   💡 Ayudas utilizadas: {result['helps']}\n\n")
-
-                # Cálculo de porcentaje de completitud
-                total_celdas = 81
-                celdas_llenas = total_celdas - result['empty']
-                porcentaje_completitud = (celdas_llenas / total_celdas) * 100
-
-                # Cálculo de precisión (de las celdas llenas, cuántas son correctas)
-                if celdas_llenas > 0:
-                    celdas_correctas = len(result['cell_status']['correct'])
-                    porcentaje_precision = (celdas_correctas / celdas_llenas) * 100
-                else:
-                    porcentaje_precision = 0
-
-                file.write("─" * 70 + "\n")
-                file.write("📊 ANÁLISIS DE DESEMPEÑO\n")
-                file.write("─" * 70 + "\n")
-                file.write(f"   Completitud: {porcentaje_completitud:.1f}%\n")
-                file.write(f"   Precisión: {porcentaje_precision:.1f}%\n")
-
-                # Evaluación del desempeño
-                if result['correct']:
-                    desempeño = "¡EXCELENTE! ⭐⭐⭐"
-                elif porcentaje_precision >= 90:
-                    desempeño = "MUY BUENO ⭐⭐"
-                elif porcentaje_precision >= 70:
-                    desempeño = "BUENO ⭐"
-                else:
-                    desempeño = "NECESITA MEJORAR"
-
-                file.write(f"   Evaluación: {desempeño}\n\n")
-
-            return os.path.abspath(filename)
+            # Si el archivo ya existe, agregar separador antes del registro
+            if os.path.isfile(self._stats_path):
+                parts.insert(0, GAME_SEPARATOR)
+
+            # Abrir archivo en modo append (agregar al final) con una sola escritura
+            with open(self._stats_path, 'a', encoding='utf-8') as file:
+                file.write("".join(parts))
+
+            return self._stats_path
 
         except Exception as e:
             print(f"Error al guardar estadísticas: {e}")
@@ -479,7 +708,7 @@ class SudokuGame:
         Returns:
             float: Tiempo transcurrido en segundos desde el inicio del juego
         """
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
 
     def reset_game(self):
         """
@@ -494,8 +723,10 @@ class SudokuGame:
         Returns:
             None
         """
-        self.current_board = [row[:] for row in self.puzzle]
-        self.start_time = time.time()
+        # Copia en el mismo bytearray para conservar las vistas NumPy
+        self.current_board[:] = self._puzzle_bytes
+        self.start_time = time.monotonic()
         self.errors_count = 0
         self.helps_used = 0
         self.is_finished = False
+        self._build_masks()
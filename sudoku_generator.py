@@ -2,8 +2,34 @@
 Generador de tableros de Sudoku con diferentes niveles de dificultad
 """
 
+import os
 import random
-from typing import List, Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+from sudoku_numba import NUMBA_AVAILABLE, fill_board, np
+
+
+# Cantidad de permutaciones precalculadas (2**PERM_BITS, se eligen con getrandbits)
+PERM_BITS = 12
+PERM_COUNT = 1 << PERM_BITS
+
+# Geometría fija del tablero 9x9, precalculada una sola vez al importar:
+# BOX_OF[row*9 + col] es el subcuadro de la celda (81 bytes contiguos) y
+# BOX_CELLS[box] son los 9 índices planos de las celdas de ese subcuadro
+BOX_OF = bytes((row // 3) * 3 + col // 3 for row in range(9) for col in range(9))
+BOX_CELLS = tuple(tuple(idx for idx in range(81) if BOX_OF[idx] == box) for box in range(9))
+
+# Tablas por máscara de candidatos (512 máscaras posibles de 9 bits):
+# dígitos ordenados que contiene y cantidad de bits encendidos
+MASK_TO_DIGITS = tuple(tuple(d for d in range(1, 10) if mask & (1 << (d - 1))) for mask in range(512))
+POPCOUNT = bytes(bin(mask).count('1') for mask in range(512))
+
+# Índices planos de cada unidad (9 filas, 9 columnas y 9 subcuadros)
+UNITS = (tuple(tuple(range(row * 9, row * 9 + 9)) for row in range(9)) +
+         tuple(tuple(range(col, 81, 9)) for col in range(9)) +
+         BOX_CELLS)
 
 
 class SudokuGenerator:
@@ -16,6 +42,12 @@ class SudokuGenerator:
     Atributos:
         size (int): Tamaño del tablero (9x9)
         box_size (int): Tamaño de cada subcuadro (3x3)
+        row_mask (array): Máscara de bits por fila (bit k = dígito k+1 usado)
+        col_mask (array): Máscara de bits por columna
+        box_mask (array): Máscara de bits por subcuadro 3x3
+        _rng (random.Random): Generador aleatorio propio de la instancia
+        _digits (Tuple[int, ...]): Dígitos del 1 al 9
+        _perms (List[Tuple[int, ...]]): Permutaciones aleatorias de 1-9 precalculadas
     """
 
     def __init__(self):
@@ -30,13 +62,23 @@ class SudokuGenerator:
         """
         self.size = 9
         self.box_size = 3
+        self.row_mask = array('H', [0] * self.size)
+        self.col_mask = array('H', [0] * self.size)
+        self.box_mask = array('H', [0] * self.size)
+
+        # Generador aleatorio propio: evita el estado global del módulo random
+        self._rng = random.Random()
+        self._digits = (1, 2, 3, 4, 5, 6, 7, 8, 9)
+
+        # Órdenes aleatorios de dígitos precalculados para el backtracking
+        self._perms = [tuple(self._rng.sample(self._digits, 9)) for _ in range(PERM_COUNT)]
 
     def generate_complete_board(self) -> List[List[int]]:
         """
         Genera un tablero de Sudoku completamente resuelto
 
-        Crea una matriz 9x9 inicializada en ceros y la llena usando
-        el algoritmo de backtracking para garantizar una solución válida.
+        Envoltura de generate_complete_board_flat() que entrega el
+        tablero como matriz 9x9 para compatibilidad.
 
         Args:
             Ninguno
@@ -44,86 +86,265 @@ class SudokuGenerator:
         Returns:
             List[List[int]]: Tablero 9x9 completamente resuelto con números del 1 al 9
         """
-        board = [[0 for _ in range(self.size)] for _ in range(self.size)]
+        return self._to_nested(self.generate_complete_board_flat())
+
+    def generate_complete_board_flat(self) -> bytearray:
+        """
+        Genera un tablero de Sudoku completamente resuelto en forma plana
+
+        Crea un tablero plano de 81 bytes inicializado en ceros, reinicia las
+        máscaras de bits y lo llena usando el algoritmo de backtracking para
+        garantizar una solución válida. Si Numba está disponible, el núcleo
+        compilado de `sudoku_numba` llena directamente el mismo bytearray a
+        través de una vista NumPy, sin copias.
+
+        Args:
+            Ninguno
+
+        Returns:
+            bytearray: Tablero plano de 81 celdas (celda (row, col) en row*9 + col)
+        """
+        board = bytearray(self.size * self.size)
+
+        if NUMBA_AVAILABLE:
+            fill_board(np.frombuffer(board, dtype=np.int8),
+                       np.zeros(self.size, dtype=np.uint16),
+                       np.zeros(self.size, dtype=np.uint16),
+                       np.zeros(self.size, dtype=np.uint16),
+                       self._rng.getrandbits(63) | 1)
+            return board
+
+        for i in range(self.size):
+            self.row_mask[i] = 0
+            self.col_mask[i] = 0
+            self.box_mask[i] = 0
+
+        # Sembrar los subcuadros diagonales y propagar singles antes del
+        # backtracking para reducir el árbol de búsqueda
+        self._prefill_diagonal_boxes(board)
+        self._propagate_singles(board)
+
         self._fill_board(board)
         return board
 
-    def _fill_board(self, board: List[List[int]]) -> bool:
+    def _place(self, board: bytearray, idx: int, num: int):
         """
-        Llena el tablero usando backtracking
-
-        Método recursivo que prueba números del 1 al 9 en orden aleatorio
-        para cada celda vacía. Si encuentra una celda donde ningún número
-        es válido, retrocede (backtrack) y prueba otra opción.
+        Coloca un número en el tablero plano y actualiza las máscaras
 
         Args:
-            board (List[List[int]]): Tablero 9x9 a llenar (modificado in-place)
+            board (bytearray): Tablero plano de 81 celdas (modificado in-place)
+            idx (int): Índice plano de la celda (row*9 + col)
+            num (int): Número a colocar (1-9)
 
         Returns:
-            bool: True si se logró llenar todo el tablero, False si no hay solución
+            None
         """
-        for row in range(self.size):
-            for col in range(self.size):
-                if board[row][col] == 0:
-                    numbers = list(range(1, 10))
-                    random.shuffle(numbers)
+        row, col = divmod(idx, self.size)
+        box = BOX_OF[idx]
+        bit = 1 << (num - 1)
+
+        board[idx] = num
+        self.row_mask[row] |= bit
+        self.col_mask[col] |= bit
+        self.box_mask[box] |= bit
+
+    def _prefill_diagonal_boxes(self, board: bytearray):
+        """
+        Llena los tres subcuadros de la diagonal con permutaciones aleatorias
+
+        Los subcuadros (0,0), (3,3) y (6,6) no comparten filas, columnas
+        ni subcuadro entre sí, por lo que cualquier permutación de 1-9 en
+        cada uno es válida y siempre admite una solución completa.
 
-                    for num in numbers:
-                        if self._is_valid(board, row, col, num):
-                            board[row][col] = num
+        Args:
+            board (bytearray): Tablero plano vacío (modificado in-place)
+
+        Returns:
+            None
+        """
+        for box in (0, 4, 8):
+            digits = self._rng.sample(self._digits, 9)
+            for idx, num in zip(BOX_CELLS[box], digits):
+                self._place(board, idx, num)
 
-                            if self._fill_board(board):
-                                return True
+    def _candidates(self, idx: int) -> int:
+        """
+        Calcula la máscara de candidatos de una celda
 
-                            board[row][col] = 0
+        Args:
+            idx (int): Índice plano de la celda (row*9 + col)
 
-                    return False
-        return True
+        Returns:
+            int: Máscara de 9 bits con los dígitos que aún caben en la celda
+        """
+        row, col = divmod(idx, self.size)
+        return ~(self.row_mask[row] | self.col_mask[col] | self.box_mask[BOX_OF[idx]]) & 0x1FF
 
-    def _is_valid(self, board: List[List[int]], row: int, col: int, num: int) -> bool:
+    def _propagate_singles(self, board: bytearray):
         """
-        Verifica si un número es válido en una posición dada
+        Coloca los singles desnudos y ocultos hasta llegar a un punto fijo
 
-        Comprueba las tres reglas fundamentales del Sudoku:
-        1. No repetir en la fila
-        2. No repetir en la columna
-        3. No repetir en el subcuadro 3x3
+        Un single desnudo es una celda con un único candidato. Un single
+        oculto es un dígito que solo cabe en una celda de su fila, columna
+        o subcuadro; se detecta en paralelo para los 9 dígitos acumulando
+        dos máscaras por unidad: `once` (candidato en al menos una celda)
+        y `twice` (candidato en al menos dos). Los bits de `once & ~twice`
+        son los singles ocultos. Se repite mientras se haya colocado algún
+        número, ya que cada colocación puede dejar nuevos singles.
 
         Args:
-            board (List[List[int]]): Tablero actual a validar
-            row (int): Fila donde se quiere colocar el número (0-8)
-            col (int): Columna donde se quiere colocar el número (0-8)
-            num (int): Número a validar (1-9)
+            board (bytearray): Tablero plano de 81 celdas (modificado in-place)
 
         Returns:
-            bool: True si el número es válido en esa posición, False en caso contrario
+            None
         """
-        # Verificar fila
-        if num in board[row]:
-            return False
+        candidates_of = self._candidates
+        changed = True
+        while changed:
+            changed = False
+
+            # Singles desnudos: un solo bit encendido
+            for idx in range(self.size * self.size):
+                if board[idx] == 0:
+                    candidates = candidates_of(idx)
+                    if POPCOUNT[candidates] == 1:
+                        self._place(board, idx, MASK_TO_DIGITS[candidates][0])
+                        changed = True
+
+            # Singles ocultos: dígitos que aparecen como candidato una sola vez
+            for unit in UNITS:
+                once = 0
+                twice = 0
+                for idx in unit:
+                    if board[idx] == 0:
+                        candidates = candidates_of(idx)
+                        twice |= once & candidates
+                        once |= candidates
+
+                hidden = once & ~twice
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for idx in unit:
+                        if board[idx] == 0 and candidates_of(idx) & bit:
+                            self._place(board, idx, bit.bit_length())
+                            changed = True
+                            break
+
+    def _fill_board(self, board: bytearray) -> bool:
+        """
+        Llena el tablero usando backtracking iterativo con selección MRV
+
+        En cada paso elige la celda vacía con menos candidatos posibles
+        (Minimum Remaining Values) y prueba sus candidatos en orden
+        aleatorio. Usa una pila explícita en lugar de recursión: cada
+        entrada guarda la celda y los candidatos que faltan por probar.
+        Si una celda se queda sin candidatos, se desapila y se retrocede
+        (backtrack) a la celda anterior.
 
-        # Verificar columna
-        for r in range(self.size):
-            if board[r][col] == num:
+        Args:
+            board (bytearray): Tablero plano de 81 celdas a llenar (modificado in-place)
+
+        Returns:
+            bool: True si se logró llenar todo el tablero, False si no hay solución
+        """
+        # Enlaces locales para evitar búsquedas de atributos en el ciclo
+        row_mask = self.row_mask
+        col_mask = self.col_mask
+        box_mask = self.box_mask
+        select_cell = self._select_cell
+        perms = self._perms
+        getrandbits = self._rng.getrandbits
+        box_of = BOX_OF
+        popcount = POPCOUNT
+        mask_to_digits = MASK_TO_DIGITS
+        stack = []
+
+        while True:
+            cell = select_cell(board)
+            if cell is None:
+                return True
+
+            idx, candidates = cell
+            row, col = divmod(idx, 9)
+            box = box_of[idx]
+
+            if popcount[candidates] <= 1:
+                # Cero o un candidato: no hay orden que sortear
+                numbers = list(mask_to_digits[candidates])
+            else:
+                # Orden aleatorio tomado de la tabla de permutaciones precalculadas
+                order = perms[getrandbits(PERM_BITS)]
+                numbers = [num for num in order if (candidates >> (num - 1)) & 1]
+            stack.append((idx, row, col, box, numbers))
+
+            # Colocar el siguiente candidato disponible, retrocediendo si hace falta
+            while stack:
+                idx, row, col, box, numbers = stack[-1]
+
+                num = board[idx]
+                if num:
+                    bit = 1 << (num - 1)
+                    board[idx] = 0
+                    row_mask[row] ^= bit
+                    col_mask[col] ^= bit
+                    box_mask[box] ^= bit
+
+                if numbers:
+                    num = numbers.pop()
+                    bit = 1 << (num - 1)
+                    board[idx] = num
+                    row_mask[row] |= bit
+                    col_mask[col] |= bit
+                    box_mask[box] |= bit
+                    break
+
+                stack.pop()
+            else:
                 return False
 
-        # Verificar subcuadro 3x3
-        start_row = (row // self.box_size) * self.box_size
-        start_col = (col // self.box_size) * self.box_size
+    def _select_cell(self, board: bytearray) -> Optional[Tuple[int, int]]:
+        """
+        Selecciona la celda vacía con menos candidatos (heurística MRV)
 
-        for r in range(start_row, start_row + self.box_size):
-            for c in range(start_col, start_col + self.box_size):
-                if board[r][c] == num:
-                    return False
+        Args:
+            board (bytearray): Tablero plano de 81 celdas
 
-        return True
+        Returns:
+            Optional[Tuple[int, int]]: Tupla (índice, máscara de candidatos) de la
+                celda elegida, o None si el tablero ya está lleno
+        """
+        row_mask = self.row_mask
+        col_mask = self.col_mask
+        box_mask = self.box_mask
+        box_of = BOX_OF
+        popcount = POPCOUNT
+        best = None
+        best_count = 10
+
+        for idx, value in enumerate(board):
+            if value == 0:
+                row, col = divmod(idx, 9)
+                candidates = ~(row_mask[row] | col_mask[col] | box_mask[box_of[idx]]) & 0x1FF
+                count = popcount[candidates]
+
+                if count < best_count:
+                    best = (idx, candidates)
+                    best_count = count
+                    # Con 0 o 1 candidatos no hay una celda mejor
+                    if count <= 1:
+                        break
+
+        return best
 
     def create_puzzle(self, difficulty: str) -> Tuple[List[List[int]], List[List[int]]]:
         """
         Crea un tablero de Sudoku con celdas vacías según la dificultad
 
         Genera primero un tablero completo válido y luego elimina celdas
-        aleatoriamente según el nivel de dificultad seleccionado.
+        aleatoriamente según el nivel de dificultad seleccionado. Las celdas
+        se eliminan en pares simétricos respecto al centro, (r, c) y
+        (8-r, 8-c), más la celda central cuando la cantidad es impar.
 
         Args:
             difficulty (str): Nivel de dificultad - 'Fácil', 'Medio', o 'Difícil'
@@ -136,11 +357,9 @@ class SudokuGenerator:
                 - Primera: Tablero del juego con celdas vacías (marcadas con 0)
                 - Segunda: Solución completa del tablero
         """
-        # Generar tablero completo (solución)
-        solution = self.generate_complete_board()
-
-        # Crear copia para el tablero de juego
-        puzzle = [row[:] for row in solution]
+        # Generar tablero completo (solución) y copiarlo para el tablero de juego
+        solution = self.generate_complete_board_flat()
+        puzzle = solution[:]
 
         # Determinar número de celdas a eliminar según dificultad
         cells_to_remove = {
@@ -151,27 +370,109 @@ class SudokuGenerator:
 
         remove_count = cells_to_remove.get(difficulty, 40)
 
-        # Eliminar celdas aleatoriamente
-        positions = [(r, c) for r in range(self.size) for c in range(self.size)]
-        random.shuffle(positions)
+        # Eliminar celdas en pares simétricos: el índice plano idx < 40 se
+        # empareja con 80 - idx, y el centro (40) queda sin pareja
+        last = self.size * self.size - 1
+        center = last // 2
+        for idx in self._rng.sample(range(center), remove_count // 2):
+            puzzle[idx] = 0
+            puzzle[last - idx] = 0
 
-        for i in range(remove_count):
-            row, col = positions[i]
-            puzzle[row][col] = 0
+        if remove_count % 2:
+            puzzle[center] = 0
 
-        return puzzle, solution
+        return self._to_nested(puzzle), self._to_nested(solution)
 
-    def copy_board(self, board: List[List[int]]) -> List[List[int]]:
+    def copy_board(self, board: Union[List[List[int]], bytearray]) -> Union[List[List[int]], bytearray]:
         """
         Crea una copia profunda del tablero
 
         Genera una copia independiente del tablero para evitar modificar
-        el original por referencia.
+        el original por referencia. Un tablero plano (bytearray de 81
+        celdas) se copia con un solo slice, que es una copia de memoria
+        contigua; una matriz 9x9 se copia fila por fila.
 
         Args:
-            board (List[List[int]]): Tablero original a copiar
+            board (Union[List[List[int]], bytearray]): Tablero original a copiar
 
         Returns:
-            List[List[int]]: Nueva matriz 9x9 con los mismos valores que el original
+            Union[List[List[int]], bytearray]: Copia del tablero con la misma
+                representación que el original
         """
+        if isinstance(board, (bytes, bytearray)):
+            return board[:]
         return [row[:] for row in board]
+
+    def _to_nested(self, board: bytearray) -> List[List[int]]:
+        """
+        Convierte un tablero plano a matriz 9x9
+
+        Se usa solo en la frontera de la API pública, que sigue
+        entregando listas de listas.
+
+        Args:
+            board (bytearray): Tablero plano de 81 celdas
+
+        Returns:
+            List[List[int]]: Matriz 9x9 con los mismos valores
+        """
+        size = self.size
+        return [list(board[row * size:(row + 1) * size]) for row in range(size)]
+
+    def create_puzzles_batch(self, difficulty: str, n: int) -> List[Tuple[List[List[int]], List[List[int]]]]:
+        """
+        Crea varios tableros de Sudoku en paralelo
+
+        Cada tablero es independiente, así que se reparten entre procesos
+        con un ProcessPoolExecutor (sin contención del GIL). Cada proceso
+        trabajador crea su propio generador con una semilla distinta.
+
+        Args:
+            difficulty (str): Nivel de dificultad - 'Fácil', 'Medio', o 'Difícil'
+            n (int): Cantidad de tableros a generar
+
+        Returns:
+            List[Tuple[List[List[int]], List[List[int]]]]: Lista de n tuplas
+                (tablero del juego, solución) como las de create_puzzle()
+        """
+        if n <= 0:
+            return []
+
+        chunksize = max(1, n // (os.cpu_count() or 1) // 4)
+        with ProcessPoolExecutor(initializer=_init_worker) as executor:
+            return list(executor.map(_make_one, [difficulty] * n, chunksize=chunksize))
+
+
+# Generador propio de cada proceso trabajador de create_puzzles_batch
+_worker_generator: Optional[SudokuGenerator] = None
+
+
+def _init_worker():
+    """
+    Inicializa un proceso trabajador para la generación en paralelo
+
+    Crea un SudokuGenerator propio del proceso. Su random.Random se
+    siembra al crearse dentro del proceso hijo, así que los procesos
+    creados con fork no repiten la secuencia del padre.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    global _worker_generator
+    _worker_generator = SudokuGenerator()
+
+
+def _make_one(difficulty: str) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Crea un tablero dentro de un proceso trabajador
+
+    Args:
+        difficulty (str): Nivel de dificultad - 'Fácil', 'Medio', o 'Difícil'
+
+    Returns:
+        Tuple[List[List[int]], List[List[int]]]: Tablero del juego y su solución
+    """
+    return _worker_generator.create_puzzle(difficulty)
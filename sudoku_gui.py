@@ -4,12 +4,39 @@ Interfaz gráfica de usuario para el juego Sudoku usando Tkinter
 
 import tkinter as tk
 from tkinter import messagebox, ttk
+from tkinter import font as tkfont
+from functools import partial
 from sudoku_generator import SudokuGenerator
 from sudoku_game import SudokuGame
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import queue
+import threading
 import time
 
 
+# Resumen de la verificación del tablero
+VERIFY_TEMPLATE = (
+    "✅ Correctas: {correct}\n"
+    "❌ Incorrectas: {incorrect}\n"
+    "⬜ Vacías: {empty}"
+)
+
+# Cuerpo del mensaje de fin de partida (entre el encabezado y la ruta de estadísticas)
+FINISH_TEMPLATE = (
+    "⏱️ Tiempo: {minutes:02d}:{seconds:02d}\n"
+    "🏆 Puntuación Final: {score}\n\n"
+    "📈 Detalles:\n"
+    "  • Bonificación por tiempo: +{time_bonus}\n"
+    "  • Penalización por errores: -{error_penalty}\n"
+    "  • Penalización por ayudas: -{help_penalty}\n\n"
+    "📊 Estadísticas:\n"
+    "  • Celdas correctas: {correct_cells}\n"
+    "  • Celdas incorrectas: {errors}\n"
+    "  • Celdas vacías: {empty}\n"
+    "  • Ayudas usadas: {helps}\n\n"
+)
+
+
 class SudokuGUI:
     """
     Interfaz gráfica principal del juego Sudoku
@@ -20,14 +47,52 @@ class SudokuGUI:
     Atributos:
         master (tk.Tk): Ventana principal de Tkinter
         colors (dict): Paleta de colores para la interfaz
+        fonts (dict): Fuentes (tkfont.Font) de la interfaz, por uso
         generator (SudokuGenerator): Generador de tableros
         game (Optional[SudokuGame]): Instancia del juego actual
-        cells (List[List[tk.Entry]]): Matriz de widgets de celdas
+        cell_rects (List[int]): Identificadores de los rectángulos del Canvas de
+            las 81 celdas; la celda (row, col) está en el índice row*9 + col
+        cell_texts (List[int]): Identificadores de los textos de las celdas,
+            con el mismo orden plano que cell_rects
         selected_cell (Optional[tuple]): Celda actualmente seleccionada
+        _fixed_mask (int): Entero de 81 bits del juego actual; el bit row*9 + col
+            está encendido si la celda es fija
+        _default_fill (List[str]): Color de fondo por defecto de cada celda
+            (fija o editable) del juego actual, en orden plano
+        _board_dirty (bool): Indica si el tablero cambió desde la última verificación
+        _cached_status (Optional[dict]): Último resultado de check_all_cells()
+        _dirty_cells (set): Índices planos de las celdas cuyo color se repintará en la próxima pausa
+            del bucle de eventos
         help_mode (bool): Indica si el modo ayuda está activo
         timer_running (bool): Indica si el temporizador está corriendo
+        _next_puzzle (Optional[tuple]): Puzzle generado por adelantado en segundo
+            plano, como (dificultad, puzzle, solución)
+        game_frame (Optional[tk.Frame]): Frame de la interfaz de juego; se crea
+            una sola vez y se reutiliza en las partidas siguientes
+        start_frame (Optional[tk.Frame]): Frame de la pantalla de inicio; también
+            se crea una sola vez y solo se oculta o muestra
     """
 
+    # Tamaño en píxeles de cada celda del tablero
+    CELL_SIZE = 60
+
+    # Intervalo (ms) para revisar si el hilo de generación ya terminó
+    _POLL_MS = 20
+
+    # Teclas de dígito aceptadas en el tablero y su valor
+    _KEYMAP = {str(n): n for n in range(1, 10)}
+
+    # Teclas que borran la celda seleccionada
+    _DELETE_KEYS = frozenset(('BackSpace', 'Delete'))
+
+    # Opciones comunes a todos los botones creados con _mk_button
+    _BTN_DEFAULTS = {
+        'fg': '#1e1e2e',
+        'activeforeground': '#1e1e2e',
+        'bd': 0,
+        'cursor': 'hand2'
+    }
+
     def __init__(self, master):
         """
         Inicializa la interfaz gráfica del juego Sudoku
@@ -58,17 +123,51 @@ class SudokuGUI:
             'panel': '#181825'
         }
 
+        # Fuentes, creadas una sola vez y compartidas por todos los widgets
+        self.fonts = {
+            'title': tkfont.Font(self.master, family='Segoe UI', size=36, weight='bold'),
+            'cell': tkfont.Font(self.master, family='Segoe UI', size=20, weight='bold'),
+            'large': tkfont.Font(self.master, family='Segoe UI', size=14, weight='bold'),
+            'heading': tkfont.Font(self.master, family='Segoe UI', size=14),
+            'value': tkfont.Font(self.master, family='Segoe UI', size=12, weight='bold'),
+            'body': tkfont.Font(self.master, family='Segoe UI', size=12),
+            'button': tkfont.Font(self.master, family='Segoe UI', size=11, weight='bold'),
+            'text_bold': tkfont.Font(self.master, family='Segoe UI', size=10, weight='bold'),
+            'text': tkfont.Font(self.master, family='Segoe UI', size=10),
+            'small': tkfont.Font(self.master, family='Segoe UI', size=9)
+        }
+
         # Variables del juego
         self.generator = SudokuGenerator()
         self.game: Optional[SudokuGame] = None
-        self.cells: List[List[tk.Entry]] = []
+        self._next_puzzle: Optional[tuple] = None
+        self._prefetch_lock = threading.Lock()
+        self._puzzle_queue: queue.Queue = queue.Queue()
+        self.cell_rects: List[int] = []
+        self.cell_texts: List[int] = []
+        self._shown_text: List[str] = []
         self.selected_cell: Optional[tuple] = None
+        self._fixed_mask = 0
+        self._default_fill: List[str] = []
+        self._board_dirty = True
+        self._cached_status: Optional[dict] = None
+        self._dirty_cells = set()
+        self._flush_scheduled = False
         self.help_mode = False
         self.timer_running = False
+        self._last_timer_text: Optional[str] = None
+        self._timer_job: Optional[str] = None
+        self._status_job: Optional[str] = None
+        self.game_frame: Optional[tk.Frame] = None
+        self.start_frame: Optional[tk.Frame] = None
+        self.loading_label: Optional[tk.Label] = None
 
         # Configurar estilo
         self._configure_styles()
 
+        # Ventana de mensajes reutilizable (oculta hasta que se necesita)
+        self._create_info_dialog()
+
         # Mostrar pantalla de inicio
         self._show_start_screen()
 
@@ -95,18 +194,178 @@ class SudokuGUI:
                         foreground='#1e1e2e',
                         borderwidth=0,
                         focuscolor='none',
-                        font=('Segoe UI', 10, 'bold'),
+                        font=self.fonts['text_bold'],
                         padding=10)
 
         style.map('Game.TButton',
                   background=[('active', self.colors['button_hover'])])
 
+        # Estilo de los botones del teclado numérico
+        style.configure('Num.TButton',
+                        background=self.colors['button'],
+                        foreground='#1e1e2e',
+                        borderwidth=0,
+                        focuscolor='none',
+                        font=self.fonts['large'],
+                        padding=6)
+
+        style.map('Num.TButton',
+                  background=[('active', self.colors['button_hover'])])
+
+    def _create_info_dialog(self):
+        """
+        Crea la ventana de mensajes que se reutiliza durante toda la sesión
+
+        La ventana se crea oculta una sola vez; _show_info solo cambia su
+        título y texto y la vuelve a mostrar, en lugar de construir un
+        diálogo nuevo por cada mensaje. Igual que messagebox.showinfo, se
+        cierra con el botón, con Enter o con Escape.
+
+        Args:
+            Ninguno
+
+        Returns:
+            None
+        """
+        self._info_top = tk.Toplevel(self.master, bg=self.colors['bg'])
+        self._info_top.withdraw()
+        self._info_top.transient(self.master)
+        self._info_top.resizable(False, False)
+        self._info_top.protocol('WM_DELETE_WINDOW', self._hide_info)
+
+        self._info_var = tk.StringVar(self.master, value="")
+        tk.Label(self._info_top,
+                 textvariable=self._info_var,
+                 font=self.fonts['body'],
+                 bg=self.colors['bg'],
+                 fg=self.colors['fg'],
+                 justify='left').pack(padx=25, pady=(20, 10))
+
+        self._info_btn = self._mk_button(self._info_top, "Aceptar", self.colors['button'],
+                                         self._hide_info,
+                                         activebackground=self.colors['button_hover'],
+                                         padx=20)
+        self._info_btn.pack(pady=(0, 15))
+
+        # Atajos de teclado para cerrar la ventana
+        for sequence in ('<Return>', '<KP_Enter>', '<Escape>'):
+            self._info_top.bind(sequence, self._hide_info)
+
+        # Se marca al cerrar la ventana para terminar la espera de _show_info
+        self._info_closed = tk.BooleanVar(self.master, value=False)
+
+    def _show_info(self, title: str, message: str):
+        """
+        Muestra un mensaje en la ventana reutilizable y espera a que se cierre
+
+        Igual que messagebox.showinfo, la ventana es modal: se centra sobre
+        la ventana principal, toma el foco de la aplicación (en el botón
+        Aceptar) y el método no regresa hasta que el jugador la cierra.
+        Al cerrarse se devuelven el foco y el grab que había antes, como
+        hacen tk::SetFocusGrab y tk::RestoreFocusGrab.
+
+        Args:
+            title (str): Título de la ventana
+            message (str): Texto del mensaje
+
+        Returns:
+            None
+        """
+        top = self._info_top
+        top.title(title)
+        self._info_var.set(message)
+        self._info_closed.set(False)
+
+        # Guardar el foco y el grab actuales para restaurarlos al cerrar
+        old_focus = top.focus_get()
+        old_grab = top.grab_current()
+        old_grab_status = old_grab.grab_status() if old_grab is not None else None
+
+        # Centrar la ventana sobre la ventana principal
+        top.update_idletasks()
+        x = self.master.winfo_rootx() + (self.master.winfo_width() - top.winfo_reqwidth()) // 2
+        y = self.master.winfo_rooty() + (self.master.winfo_height() - top.winfo_reqheight()) // 2
+        top.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+
+        top.deiconify()
+        top.lift()
+
+        # La ventana debe estar visible antes de tomar el foco exclusivo; si
+        # aun así falla (como contempla msgbox.tcl), se sigue sin él
+        top.wait_visibility()
+        try:
+            top.grab_set()
+        except tk.TclError:
+            pass
+        self._info_btn.focus_set()
+
+        try:
+            self.master.wait_variable(self._info_closed)
+        finally:
+            self._restore_focus_grab(old_focus, old_grab, old_grab_status)
+
+    def _restore_focus_grab(self, old_focus, old_grab, old_grab_status: Optional[str]):
+        """
+        Devuelve el foco y el grab que había antes de abrir la ventana de mensajes
+
+        Args:
+            old_focus (Optional[tk.Widget]): Widget que tenía el foco
+            old_grab (Optional[tk.Widget]): Widget que tenía el grab
+            old_grab_status (Optional[str]): 'local' o 'global' según el grab previo
+
+        Returns:
+            None
+        """
+        try:
+            if old_focus is not None and old_focus.winfo_exists():
+                old_focus.focus_set()
+            if old_grab is not None and old_grab.winfo_exists():
+                if old_grab_status == 'global':
+                    old_grab.grab_set_global()
+                else:
+                    old_grab.grab_set()
+        except tk.TclError:
+            pass
+
+    def _hide_info(self, event=None):
+        """
+        Oculta la ventana de mensajes sin destruirla
+
+        Args:
+            event (Optional[tk.Event]): Evento de teclado, si se cerró con Enter o Escape
+
+        Returns:
+            None
+        """
+        self._info_top.grab_release()
+        self._info_top.withdraw()
+        self._info_closed.set(True)
+
+    def _mk_button(self, parent, text: str, bg: str, cmd, **over) -> tk.Button:
+        """
+        Crea un botón con las opciones comunes de la interfaz
+
+        Args:
+            parent (tk.Widget): Widget contenedor del botón
+            text (str): Texto del botón
+            bg (str): Color de fondo
+            cmd (Callable): Función a ejecutar al presionar el botón
+            **over: Opciones de tk.Button que reemplazan o amplían _BTN_DEFAULTS
+                (la fuente por defecto es self.fonts['button'])
+
+        Returns:
+            tk.Button: Botón creado (sin empaquetar)
+        """
+        return tk.Button(parent, text=text, bg=bg, command=cmd,
+                         **{'font': self.fonts['button'], **self._BTN_DEFAULTS, **over})
+
     def _show_start_screen(self):
         """
         Muestra la pantalla de inicio con selección de dificultad
 
         Crea la pantalla inicial con el título, autores y botones
-        para seleccionar el nivel de dificultad del juego.
+        para seleccionar el nivel de dificultad del juego. La pantalla se
+        construye solo la primera vez; después únicamente se vuelve a mostrar.
 
         Args:
             Ninguno
@@ -114,20 +373,24 @@ class SudokuGUI:
         Returns:
             None
         """
+        if self.start_frame is not None:
+            self.start_frame.pack(padx=40, pady=40)
+            return
+
         self.start_frame = tk.Frame(self.master, bg=self.colors['bg'])
         self.start_frame.pack(padx=40, pady=40)
 
         # Título
         title = tk.Label(self.start_frame,
                          text="🎮 SUDOKU",
-                         font=('Segoe UI', 36, 'bold'),
+                         font=self.fonts['title'],
                          bg=self.colors['bg'],
                          fg=self.colors['button'])
         title.pack(pady=(0, 10))
 
         subtitle = tk.Label(self.start_frame,
                             text="Juego Cognitivo",
-                            font=('Segoe UI', 14),
+                            font=self.fonts['heading'],
                             bg=self.colors['bg'],
                             fg=self.colors['fg'])
         subtitle.pack(pady=(0, 30))
@@ -135,7 +398,7 @@ class SudokuGUI:
         # Autores
         authors = tk.Label(self.start_frame,
                           text="Por: Alonso Osuna Maruri - A01613556\nLeonardo Montoya Chavarría - A01613677",
-                          font=('Segoe UI', 9),
+                          font=self.fonts['small'],
                           bg=self.colors['bg'],
                           fg=self.colors['fixed'],
                           justify='center')
@@ -144,7 +407,7 @@ class SudokuGUI:
         # Instrucciones
         instructions = tk.Label(self.start_frame,
                                 text="Selecciona el nivel de dificultad:",
-                                font=('Segoe UI', 12),
+                                font=self.fonts['body'],
                                 bg=self.colors['bg'],
                                 fg=self.colors['fg'])
         instructions.pack(pady=(0, 20))
@@ -157,26 +420,21 @@ class SudokuGUI:
         ]
 
         for label, diff, color in difficulties:
-            btn = tk.Button(self.start_frame,
-                           text=label,
-                           font=('Segoe UI', 14, 'bold'),
-                           bg=color,
-                           fg='#1e1e2e',
-                           activebackground=color,
-                           activeforeground='#1e1e2e',
-                           bd=0,
-                           padx=40,
-                           pady=15,
-                           cursor='hand2',
-                           command=lambda d=diff: self._start_game(d))
+            btn = self._mk_button(self.start_frame, label, color,
+                                  partial(self._start_game, diff),
+                                  font=self.fonts['large'],
+                                  activebackground=color,
+                                  padx=40,
+                                  pady=15)
             btn.pack(pady=8, fill='x')
 
     def _start_game(self, difficulty: str):
         """
         Inicia un nuevo juego con la dificultad seleccionada
 
-        Destruye la pantalla de inicio, genera un nuevo tablero y
-        crea la interfaz de juego con todos sus componentes.
+        Oculta la pantalla de inicio, muestra un aviso de generación y
+        obtiene el tablero en un hilo aparte para no congelar la ventana.
+        La partida continúa en _on_puzzle_ready cuando el tablero está listo.
 
         Args:
             difficulty (str): Nivel de dificultad ('Fácil', 'Medio', 'Difícil')
@@ -184,19 +442,159 @@ class SudokuGUI:
         Returns:
             None
         """
-        # Destruir pantalla de inicio
-        self.start_frame.destroy()
+        # Ocultar pantalla de inicio (se reutiliza en la siguiente partida)
+        self.start_frame.pack_forget()
+
+        # Aviso mientras se genera el tablero
+        if self.loading_label is None:
+            self.loading_label = tk.Label(self.master,
+                                          text="⏳ Generando tablero...",
+                                          font=self.fonts['heading'],
+                                          bg=self.colors['bg'],
+                                          fg=self.colors['fg'])
+        self.loading_label.pack(padx=40, pady=40)
+
+        threading.Thread(target=self._gen_worker,
+                         args=(difficulty,),
+                         daemon=True).start()
+        self.master.after(self._POLL_MS, self._poll_puzzle)
+
+    def _gen_worker(self, difficulty: str):
+        """
+        Obtiene el tablero de la nueva partida fuera del hilo de Tkinter
+
+        No toca ningún widget ni llama a Tkinter: deja el resultado (o la
+        excepción, si la generación falla) en self._puzzle_queue, que el
+        hilo de la interfaz revisa con _poll_puzzle.
+
+        Args:
+            difficulty (str): Nivel de dificultad ('Fácil', 'Medio', 'Difícil')
+
+        Returns:
+            None
+        """
+        try:
+            puzzle, solution = self._take_puzzle(difficulty)
+        except Exception as exc:
+            self._puzzle_queue.put((None, None, difficulty, exc))
+        else:
+            self._puzzle_queue.put((puzzle, solution, difficulty, None))
+
+    def _poll_puzzle(self):
+        """
+        Revisa desde el hilo de la interfaz si el tablero ya está listo
+
+        Mientras el hilo de generación no termine se vuelve a programar cada
+        _POLL_MS milisegundos. Si la generación falló, quita el aviso,
+        vuelve a la pantalla de inicio e informa del error.
+
+        Args:
+            Ninguno
+
+        Returns:
+            None
+        """
+        try:
+            puzzle, solution, difficulty, error = self._puzzle_queue.get_nowait()
+        except queue.Empty:
+            self.master.after(self._POLL_MS, self._poll_puzzle)
+            return
+
+        if error is not None:
+            self.loading_label.pack_forget()
+            self._show_start_screen()
+            self._modal(self._show_info, "⚠️ Error",
+                        f"No se pudo generar el tablero:\n{error}")
+            return
+
+        self._on_puzzle_ready(puzzle, solution, difficulty)
+
+    def _on_puzzle_ready(self, puzzle: List[List[int]], solution: List[List[int]], difficulty: str):
+        """
+        Inicia la partida con el tablero ya generado
+
+        Crea la interfaz de juego con todos sus componentes, o la reutiliza
+        si ya existe de una partida anterior, e inicia el temporizador. Al
+        final empieza a generar en segundo plano el tablero de la siguiente
+        partida.
+
+        Args:
+            puzzle (List[List[int]]): Tablero inicial con celdas vacías (0)
+            solution (List[List[int]]): Solución completa del tablero
+            difficulty (str): Nivel de dificultad ('Fácil', 'Medio', 'Difícil')
+
+        Returns:
+            None
+        """
+        self.loading_label.pack_forget()
 
-        # Generar tablero
-        puzzle, solution = self.generator.create_puzzle(difficulty)
         self.game = SudokuGame(puzzle, solution, difficulty)
 
-        # Crear interfaz de juego
-        self._create_game_interface()
+        # Las celdas fijas no cambian durante la partida
+        self._fixed_mask = 0
+        for row, col in self.game.fixed_cells:
+            self._fixed_mask |= 1 << (row * 9 + col)
+        self._default_fill = [self.colors['fixed'] if (self._fixed_mask >> idx) & 1 else self.colors['editable']
+                              for idx in range(81)]
+        self._board_dirty = True
+        self._cached_status = None
+
+        # Crear interfaz de juego (o reutilizar la existente)
+        if self.game_frame is None:
+            self._create_game_interface()
+        else:
+            self._reset_board_for_new_puzzle()
+            self.game_frame.pack(padx=20, pady=20)
 
         # Iniciar temporizador
         self._start_timer()
 
+        # Generar el siguiente tablero mientras el jugador resuelve este
+        threading.Thread(target=self._prefetch_next_puzzle,
+                         args=(difficulty,),
+                         daemon=True).start()
+
+    def _take_puzzle(self, difficulty: str) -> Tuple[List[List[int]], List[List[int]]]:
+        """
+        Obtiene el tablero para una nueva partida
+
+        Usa el tablero generado por adelantado si es de la misma dificultad;
+        si no, lo genera en el momento. El candado evita usar el generador
+        al mismo tiempo que el hilo de generación anticipada. Se llama desde
+        _gen_worker, fuera del hilo de Tkinter.
+
+        Args:
+            difficulty (str): Nivel de dificultad ('Fácil', 'Medio', 'Difícil')
+
+        Returns:
+            Tuple[List[List[int]], List[List[int]]]: (puzzle, solución)
+        """
+        with self._prefetch_lock:
+            next_puzzle = self._next_puzzle
+            self._next_puzzle = None
+
+            if next_puzzle is not None and next_puzzle[0] == difficulty:
+                return next_puzzle[1], next_puzzle[2]
+
+            return self.generator.create_puzzle(difficulty)
+
+    def _prefetch_next_puzzle(self, difficulty: str):
+        """
+        Genera en segundo plano el tablero de la siguiente partida
+
+        Se ejecuta en un hilo aparte y guarda el resultado en
+        self._next_puzzle para que _take_puzzle lo use sin esperar.
+
+        Args:
+            difficulty (str): Nivel de dificultad del tablero a generar
+
+        Returns:
+            None
+        """
+        with self._prefetch_lock:
+            puzzle, solution = self.generator.create_puzzle(difficulty)
+            self._next_puzzle = (difficulty, puzzle, solution)
+
     def _create_game_interface(self):
         """
         Crea la interfaz principal del juego
@@ -211,26 +609,69 @@ class SudokuGUI:
             None
         """
         # Frame principal
-        main_frame = tk.Frame(self.master, bg=self.colors['bg'])
-        main_frame.pack(padx=20, pady=20)
+        self.game_frame = tk.Frame(self.master, bg=self.colors['bg'])
+        self.game_frame.pack(padx=20, pady=20)
 
         # Panel superior (info y controles)
-        self._create_top_panel(main_frame)
+        self._create_top_panel(self.game_frame)
 
         # Tablero de Sudoku
-        self._create_board(main_frame)
+        self._create_board(self.game_frame)
 
         # Panel inferior (teclado numérico)
-        self._create_number_pad(main_frame)
+        self._create_number_pad(self.game_frame)
 
         # Panel de control
-        self._create_control_panel(main_frame)
+        self._create_control_panel(self.game_frame)
+
+    def _reset_board_for_new_puzzle(self):
+        """
+        Prepara la interfaz existente para el juego actual
+
+        Reutiliza los ítems del Canvas en lugar de volver a crearlos:
+        reescribe el texto y el color de cada celda según el nuevo tablero,
+        oculta el marco de selección y reinicia las etiquetas del panel
+        superior y el botón de ayuda.
+
+        Args:
+            Ninguno
+
+        Returns:
+            None
+        """
+        canvas = self.board_canvas
+        fixed_mask = self._fixed_mask
+        default_fill = self._default_fill
+        cell_rects = self.cell_rects
+        self._dirty_cells.clear()
+
+        for row in range(9):
+            for col in range(9):
+                idx = row * 9 + col
+                if (fixed_mask >> idx) & 1:
+                    text = str(self.game.get_value(row, col))
+                else:
+                    text = ""
+                self._set_cell_text(row, col, text)
+                canvas.itemconfig(cell_rects[idx], fill=default_fill[idx])
+
+        for status in ('correct', 'incorrect', 'empty'):
+            canvas.dtag('all', status)
+        canvas.itemconfig(self.selection_rect, state='hidden')
+
+        self.timer_var.set("00:00")
+        self.diff_var.set(self.game.difficulty)
+        self.help_var.set("0")
+        self.status_var.set("")
+        self.help_btn.config(text="💡 Activar Ayuda", bg='#f9e2af')
 
     def _create_top_panel(self, parent):
         """
         Crea el panel superior con información del juego
 
         Muestra el temporizador, nivel de dificultad y contador de ayudas.
+        Cada valor se enlaza a su etiqueta con un StringVar (timer_var,
+        diff_var, help_var), así que actualizarlo es un simple set().
 
         Args:
             parent (tk.Frame): Frame contenedor donde se creará el panel
@@ -247,13 +688,14 @@ class SudokuGUI:
 
         tk.Label(timer_frame,
                  text="⏱️ Tiempo:",
-                 font=('Segoe UI', 10),
+                 font=self.fonts['text'],
                  bg=self.colors['panel'],
                  fg=self.colors['fg']).pack(side='left')
 
+        self.timer_var = tk.StringVar(self.master, value="00:00")
         self.timer_label = tk.Label(timer_frame,
-                                     text="00:00",
-                                     font=('Segoe UI', 12, 'bold'),
+                                     textvariable=self.timer_var,
+                                     font=self.fonts['value'],
                                      bg=self.colors['panel'],
                                      fg=self.colors['button'])
         self.timer_label.pack(side='left', padx=5)
@@ -264,13 +706,14 @@ class SudokuGUI:
 
         tk.Label(diff_frame,
                  text="📊 Nivel:",
-                 font=('Segoe UI', 10),
+                 font=self.fonts['text'],
                  bg=self.colors['panel'],
                  fg=self.colors['fg']).pack(side='left')
 
+        self.diff_var = tk.StringVar(self.master, value=self.game.difficulty)
         self.diff_label = tk.Label(diff_frame,
-                                    text=self.game.difficulty,
-                                    font=('Segoe UI', 12, 'bold'),
+                                    textvariable=self.diff_var,
+                                    font=self.fonts['value'],
                                     bg=self.colors['panel'],
                                     fg=self.colors['selected'])
         self.diff_label.pack(side='left', padx=5)
@@ -281,13 +724,14 @@ class SudokuGUI:
 
         tk.Label(help_frame,
                  text="💡 Ayudas:",
-                 font=('Segoe UI', 10),
+                 font=self.fonts['text'],
                  bg=self.colors['panel'],
                  fg=self.colors['fg']).pack(side='left')
 
+        self.help_var = tk.StringVar(self.master, value="0")
         self.help_label = tk.Label(help_frame,
-                                    text="0",
-                                    font=('Segoe UI', 12, 'bold'),
+                                    textvariable=self.help_var,
+                                    font=self.fonts['value'],
                                     bg=self.colors['panel'],
                                     fg=self.colors['incorrect'])
         self.help_label.pack(side='left', padx=5)
@@ -296,8 +740,10 @@ class SudokuGUI:
         """
         Crea el tablero de Sudoku 9x9
 
-        Genera una matriz de 9x9 widgets Entry para el tablero,
-        con bordes más gruesos cada 3 celdas para marcar los subcuadros.
+        Dibuja el tablero completo en un único Canvas: un rectángulo y un
+        texto por celda, y líneas más gruesas cada 3 celdas para marcar los
+        subcuadros. La selección se maneja con un solo evento de click y el
+        teclado con un solo evento de tecla sobre el Canvas.
 
         Args:
             parent (tk.Frame): Frame contenedor donde se creará el tablero
@@ -305,63 +751,132 @@ class SudokuGUI:
         Returns:
             None
         """
-        board_frame = tk.Frame(parent, bg=self.colors['grid_line'], bd=3)
-        board_frame.pack(pady=10)
+        size = self.CELL_SIZE
+        board_size = size * 9
 
-        self.cells = []
+        self.board_canvas = tk.Canvas(parent,
+                                      width=board_size,
+                                      height=board_size,
+                                      bg=self.colors['grid_line'],
+                                      bd=0,
+                                      highlightthickness=0,
+                                      takefocus=1)
+        self.board_canvas.pack(pady=10)
+
+        canvas = self.board_canvas
+        self.cell_rects = []
+        self.cell_texts = []
+        self._shown_text = []
+
+        # Valores usados en cada celda, resueltos una sola vez
+        grid_line = self.colors['grid_line']
+        fg = self.colors['fg']
+        font = self.fonts['cell']
+        fixed_mask = self._fixed_mask
+        default_fill = self._default_fill
+        half = size // 2
 
         for row in range(9):
-            row_cells = []
+            y = row * size
             for col in range(9):
-                # Frame de celda con borde para las subcuadrículas
-                cell_frame = tk.Frame(board_frame,
-                                      bg=self.colors['grid_line'],
-                                      highlightthickness=0)
-
-                # Añadir bordes más gruesos cada 3 celdas
-                padx = (3 if col % 3 == 0 else 1, 3 if col % 3 == 2 else 1)
-                pady = (3 if row % 3 == 0 else 1, 3 if row % 3 == 2 else 1)
-
-                cell_frame.grid(row=row, column=col, padx=padx, pady=pady)
+                x = col * size
+                idx = row * 9 + col
 
                 # Determinar si es celda fija
-                is_fixed = self.game.is_cell_fixed(row, col)
+                is_fixed = (fixed_mask >> idx) & 1
                 value = self.game.get_value(row, col)
+                shown = str(value) if is_fixed else ""
+
+                rect = canvas.create_rectangle(x, y, x + size, y + size,
+                                               fill=default_fill[idx],
+                                               outline=grid_line,
+                                               width=1)
+                text = canvas.create_text(x + half, y + half,
+                                          text=shown,
+                                          font=font,
+                                          fill=fg)
+                self.cell_rects.append(rect)
+                self.cell_texts.append(text)
+                self._shown_text.append(shown)
+
+        # Líneas más gruesas cada 3 celdas
+        for i in range(0, 10, 3):
+            offset = i * size
+            canvas.create_line(offset, 0, offset, board_size,
+                               fill=grid_line, width=3)
+            canvas.create_line(0, offset, board_size, offset,
+                               fill=grid_line, width=3)
+
+        # Marco de la celda seleccionada, oculto hasta el primer click
+        self.selection_rect = canvas.create_rectangle(0, 0, size, size,
+                                                      outline=self.colors['selected'],
+                                                      width=3,
+                                                      state='hidden')
+
+        # Eventos
+        canvas.bind('<Button-1>', self._canvas_click)
+        canvas.bind('<Key>', self._on_key_press)
+
+    def _canvas_click(self, event):
+        """
+        Traduce un click sobre el Canvas a la celda correspondiente
+
+        Args:
+            event (tk.Event): Evento de click con coordenadas en píxeles
+
+        Returns:
+            None
+        """
+        row = event.y // self.CELL_SIZE
+        col = event.x // self.CELL_SIZE
+
+        if 0 <= row < 9 and 0 <= col < 9:
+            self.board_canvas.focus_set()
+            self._on_cell_select(row, col)
+
+    def _set_cell_text(self, row: int, col: int, text: str):
+        """
+        Cambia el texto mostrado en una celda del Canvas
+
+        Si la celda ya muestra ese texto no se hace ninguna llamada a Tk;
+        el texto mostrado se lleva en self._shown_text.
+
+        Args:
+            row (int): Fila de la celda (0-8)
+            col (int): Columna de la celda (0-8)
+            text (str): Texto a mostrar ("" para una celda vacía)
+
+        Returns:
+            None
+        """
+        idx = row * 9 + col
+        if self._shown_text[idx] == text:
+            return
 
-                # Crear Entry
-                cell = tk.Entry(cell_frame,
-                               width=2,
-                               font=('Segoe UI', 20, 'bold'),
-                               justify='center',
-                               bg=self.colors['fixed'] if is_fixed else self.colors['editable'],
-                               fg=self.colors['fg'],
-                               disabledbackground=self.colors['fixed'],
-                               disabledforeground=self.colors['fg'],
-                               bd=0,
-                               highlightthickness=2,
-                               highlightcolor=self.colors['selected'],
-                               highlightbackground=self.colors['grid_line'])
-
-                # Si es celda fija, mostrar valor y deshabilitar
-                if is_fixed:
-                    cell.insert(0, str(value))
-                    cell.config(state='disabled')
-
-                # Eventos
-                cell.bind('<FocusIn>', lambda e, r=row, c=col: self._on_cell_select(r, c))
-                cell.bind('<Key>', lambda e, r=row, c=col: self._on_key_press(e, r, c))
-
-                cell.pack(padx=2, pady=2)
-                row_cells.append(cell)
-
-            self.cells.append(row_cells)
+        self._shown_text[idx] = text
+        self.board_canvas.itemconfig(self.cell_texts[idx], text=text)
+
+    def _set_cell_bg(self, row: int, col: int, color: str):
+        """
+        Cambia el color de fondo de una celda del Canvas
+
+        Args:
+            row (int): Fila de la celda (0-8)
+            col (int): Columna de la celda (0-8)
+            color (str): Color de relleno
+
+        Returns:
+            None
+        """
+        self.board_canvas.itemconfig(self.cell_rects[row * 9 + col], fill=color)
 
     def _create_number_pad(self, parent):
         """
         Crea el teclado numérico
 
         Genera botones del 1 al 9 y un botón para borrar,
-        permitiendo ingresar números mediante clicks.
+        permitiendo ingresar números mediante clicks, y debajo una
+        etiqueta de estado para los avisos al jugador.
 
         Args:
             parent (tk.Frame): Frame contenedor donde se creará el teclado
@@ -374,42 +889,43 @@ class SudokuGUI:
 
         tk.Label(pad_frame,
                  text="Teclado Numérico:",
-                 font=('Segoe UI', 10),
+                 font=self.fonts['text'],
                  bg=self.colors['bg'],
                  fg=self.colors['fg']).pack()
 
         numbers_frame = tk.Frame(pad_frame, bg=self.colors['bg'])
         numbers_frame.pack(pady=10)
 
-        # Botones del 1 al 9
+        # Botones del 1 al 9 (sin tomar el foco, para que el teclado siga
+        # llegando al tablero después de usarlos)
         for i in range(1, 10):
-            btn = tk.Button(numbers_frame,
-                           text=str(i),
-                           font=('Segoe UI', 14, 'bold'),
-                           width=3,
-                           bg=self.colors['button'],
-                           fg='#1e1e2e',
-                           activebackground=self.colors['button_hover'],
-                           bd=0,
-                           cursor='hand2',
-                           command=lambda n=i: self._insert_number(n))
+            btn = ttk.Button(numbers_frame,
+                             text=str(i),
+                             style='Num.TButton',
+                             width=3,
+                             cursor='hand2',
+                             takefocus=False,
+                             command=partial(self._insert_number, i))
 
             row = (i - 1) // 3
             col = (i - 1) % 3
             btn.grid(row=row, column=col, padx=3, pady=3)
 
         # Botón borrar
-        clear_btn = tk.Button(numbers_frame,
-                             text="🗑️ Borrar",
-                             font=('Segoe UI', 12, 'bold'),
-                             bg=self.colors['incorrect'],
-                             fg='#1e1e2e',
-                             activebackground='#eba0ac',
-                             bd=0,
-                             cursor='hand2',
-                             command=self._clear_cell)
+        clear_btn = self._mk_button(numbers_frame, "🗑️ Borrar", self.colors['incorrect'],
+                                    self._clear_cell,
+                                    font=self.fonts['value'],
+                                    activebackground='#eba0ac')
         clear_btn.grid(row=3, column=0, columnspan=3, padx=3, pady=3, sticky='ew')
 
+        # Mensajes breves (en lugar de ventanas de advertencia)
+        self.status_var = tk.StringVar(self.master, value="")
+        tk.Label(pad_frame,
+                 textvariable=self.status_var,
+                 font=self.fonts['text'],
+                 bg=self.colors['bg'],
+                 fg=self.colors['incorrect']).pack()
+
     def _create_control_panel(self, parent):
         """
         Crea el panel de control con botones de acción
@@ -426,51 +942,27 @@ class SudokuGUI:
         control_frame.pack(pady=15, fill='x')
 
         # Botón de ayuda
-        self.help_btn = tk.Button(control_frame,
-                                  text="💡 Activar Ayuda",
-                                  font=('Segoe UI', 11, 'bold'),
-                                  bg='#f9e2af',
-                                  fg='#1e1e2e',
-                                  activebackground='#f5e0a5',
-                                  bd=0,
-                                  cursor='hand2',
-                                  command=self._toggle_help_mode)
+        self.help_btn = self._mk_button(control_frame, "💡 Activar Ayuda", '#f9e2af',
+                                        self._toggle_help_mode,
+                                        activebackground='#f5e0a5')
         self.help_btn.pack(side='left', padx=5, fill='x', expand=True)
 
         # Botón verificar
-        verify_btn = tk.Button(control_frame,
-                              text="🔍 Verificar",
-                              font=('Segoe UI', 11, 'bold'),
-                              bg=self.colors['button'],
-                              fg='#1e1e2e',
-                              activebackground=self.colors['button_hover'],
-                              bd=0,
-                              cursor='hand2',
-                              command=self._verify_board)
+        verify_btn = self._mk_button(control_frame, "🔍 Verificar", self.colors['button'],
+                                     self._verify_board,
+                                     activebackground=self.colors['button_hover'])
         verify_btn.pack(side='left', padx=5, fill='x', expand=True)
 
         # Botón finalizar
-        finish_btn = tk.Button(control_frame,
-                              text="✅ Finalizar",
-                              font=('Segoe UI', 11, 'bold'),
-                              bg=self.colors['correct'],
-                              fg='#1e1e2e',
-                              activebackground='#94e2d5',
-                              bd=0,
-                              cursor='hand2',
-                              command=self._finish_game)
+        finish_btn = self._mk_button(control_frame, "✅ Finalizar", self.colors['correct'],
+                                     self._finish_game,
+                                     activebackground='#94e2d5')
         finish_btn.pack(side='left', padx=5, fill='x', expand=True)
 
         # Botón nuevo juego
-        new_btn = tk.Button(control_frame,
-                           text="🔄 Nuevo Juego",
-                           font=('Segoe UI', 11, 'bold'),
-                           bg=self.colors['selected'],
-                           fg='#1e1e2e',
-                           activebackground='#f2cdcd',
-                           bd=0,
-                           cursor='hand2',
-                           command=self._new_game)
+        new_btn = self._mk_button(control_frame, "🔄 Nuevo Juego", self.colors['selected'],
+                                  self._new_game,
+                                  activebackground='#f2cdcd')
         new_btn.pack(side='left', padx=5, fill='x', expand=True)
 
     def _on_cell_select(self, row: int, col: int):
@@ -486,46 +978,56 @@ class SudokuGUI:
         Returns:
             None
         """
-        if self.game.is_cell_fixed(row, col):
+        if (self._fixed_mask >> (row * 9 + col)) & 1:
             return
 
         self.selected_cell = (row, col)
 
+        # Mover el marco de selección a la celda
+        x = col * self.CELL_SIZE
+        y = row * self.CELL_SIZE
+        self.board_canvas.coords(self.selection_rect, x, y, x + self.CELL_SIZE, y + self.CELL_SIZE)
+        self.board_canvas.itemconfig(self.selection_rect, state='normal')
+
         # Si el modo ayuda está activo, aplicar ayuda
         if self.help_mode:
             self._apply_help(row, col)
             self.help_mode = False
             self.help_btn.config(text="💡 Activar Ayuda", bg='#f9e2af')
 
-    def _on_key_press(self, event, row: int, col: int):
+    def _on_key_press(self, event):
         """
-        Maneja las pulsaciones de teclas en las celdas
+        Maneja las pulsaciones de teclas sobre el tablero
 
-        Procesa entrada del teclado, permitiendo solo dígitos 1-9 y
-        teclas de borrado (BackSpace, Delete).
+        Procesa entrada del teclado en la celda seleccionada, permitiendo
+        solo dígitos 1-9 y teclas de borrado (BackSpace, Delete).
 
         Args:
             event (tk.Event): Evento de pulsación de tecla
-            row (int): Fila de la celda (0-8)
-            col (int): Columna de la celda (0-8)
 
         Returns:
             str: 'break' para prevenir el comportamiento por defecto
         """
-        if self.game.is_cell_fixed(row, col):
+        if self.selected_cell is None:
+            return 'break'
+
+        row, col = self.selected_cell
+
+        if (self._fixed_mask >> (row * 9 + col)) & 1:
             return 'break'
 
         # Solo permitir números del 1-9 y teclas de control
-        if event.char.isdigit() and event.char != '0':
-            # Limpiar celda antes de insertar
-            self.cells[row][col].delete(0, tk.END)
-            self.cells[row][col].insert(0, event.char)
-            self.game.set_value(row, col, int(event.char))
+        number = self._KEYMAP.get(event.char)
+        if number is not None:
+            self._set_cell_text(row, col, event.char)
+            self.game.set_value(row, col, number)
+            self._board_dirty = True
             self._update_cell_color(row, col)
             return 'break'
-        elif event.keysym in ['BackSpace', 'Delete']:
-            self.cells[row][col].delete(0, tk.END)
+        elif event.keysym in self._DELETE_KEYS:
+            self._set_cell_text(row, col, "")
             self.game.set_value(row, col, 0)
+            self._board_dirty = True
             self._update_cell_color(row, col)
             return 'break'
         else:
@@ -545,18 +1047,18 @@ class SudokuGUI:
             None
         """
         if self.selected_cell is None:
-            messagebox.showwarning("⚠️ Advertencia", "Selecciona una celda primero")
+            self._show_status("Selecciona una celda primero")
             return
 
         row, col = self.selected_cell
 
-        if self.game.is_cell_fixed(row, col):
-            messagebox.showwarning("⚠️ Advertencia", "Esta celda no se puede modificar")
+        if (self._fixed_mask >> (row * 9 + col)) & 1:
+            self._show_status("Esta celda no se puede modificar")
             return
 
-        self.cells[row][col].delete(0, tk.END)
-        self.cells[row][col].insert(0, str(number))
+        self._set_cell_text(row, col, str(number))
         self.game.set_value(row, col, number)
+        self._board_dirty = True
         self._update_cell_color(row, col)
 
     def _clear_cell(self):
@@ -572,25 +1074,59 @@ class SudokuGUI:
             None
         """
         if self.selected_cell is None:
-            messagebox.showwarning("⚠️ Advertencia", "Selecciona una celda primero")
+            self._show_status("Selecciona una celda primero")
             return
 
         row, col = self.selected_cell
 
-        if self.game.is_cell_fixed(row, col):
-            messagebox.showwarning("⚠️ Advertencia", "Esta celda no se puede modificar")
+        if (self._fixed_mask >> (row * 9 + col)) & 1:
+            self._show_status("Esta celda no se puede modificar")
             return
 
-        self.cells[row][col].delete(0, tk.END)
+        self._set_cell_text(row, col, "")
         self.game.set_value(row, col, 0)
+        self._board_dirty = True
         self._update_cell_color(row, col)
 
+    def _show_status(self, message: str):
+        """
+        Muestra un aviso en la etiqueta de estado durante 2 segundos
+
+        Args:
+            message (str): Texto del aviso
+
+        Returns:
+            None
+        """
+        self.status_var.set(message)
+
+        # Un aviso nuevo reinicia el plazo para borrar la etiqueta
+        if self._status_job is not None:
+            self.master.after_cancel(self._status_job)
+        self._status_job = self.master.after(2000, self._clear_status)
+
+    def _clear_status(self):
+        """
+        Borra el aviso de la etiqueta de estado
+
+        Args:
+            Ninguno
+
+        Returns:
+            None
+        """
+        self._status_job = None
+        self.status_var.set("")
+
     def _update_cell_color(self, row: int, col: int):
         """
         Actualiza el color de una celda según su estado
 
-        Cambia el color de fondo de la celda basándose en si está
-        vacía o tiene un valor.
+        Devuelve la celda a su color por defecto (fijo o editable); el color
+        según corrección solo se aplica en la verificación. El repintado no
+        es inmediato: la celda se anota y todas las pendientes se pintan
+        juntas cuando Tkinter queda libre (por ejemplo, al mantener
+        presionada la tecla de borrar).
 
         Args:
             row (int): Fila de la celda (0-8)
@@ -599,16 +1135,30 @@ class SudokuGUI:
         Returns:
             None
         """
-        if self.game.is_cell_fixed(row, col):
-            return
+        self._dirty_cells.add(row * 9 + col)
 
-        value = self.game.get_value(row, col)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.master.after_idle(self._flush_dirty)
 
-        if value == 0:
-            self.cells[row][col].config(bg=self.colors['editable'])
-        else:
-            # No cambiar color automáticamente, solo en verificación
-            self.cells[row][col].config(bg=self.colors['editable'])
+    def _flush_dirty(self):
+        """
+        Pinta con su color por defecto todas las celdas pendientes
+
+        Args:
+            Ninguno
+
+        Returns:
+            None
+        """
+        self._flush_scheduled = False
+        canvas = self.board_canvas
+        cell_rects = self.cell_rects
+        default_fill = self._default_fill
+
+        for idx in self._dirty_cells:
+            canvas.itemconfig(cell_rects[idx], fill=default_fill[idx])
+        self._dirty_cells.clear()
 
     def _toggle_help_mode(self):
         """
@@ -627,9 +1177,9 @@ class SudokuGUI:
 
         if self.help_mode:
             self.help_btn.config(text="💡 Modo Ayuda Activo", bg=self.colors['correct'])
-            messagebox.showinfo("💡 Modo Ayuda",
-                              "Haz clic en una celda vacía para ver el valor correcto.\n"
-                              "Penalización: -10 puntos por ayuda.")
+            self._modal(self._show_info, "💡 Modo Ayuda",
+                        "Haz clic en una celda vacía para ver el valor correcto.\n"
+                        "Penalización: -10 puntos por ayuda.")
         else:
             self.help_btn.config(text="💡 Activar Ayuda", bg='#f9e2af')
 
@@ -647,17 +1197,80 @@ class SudokuGUI:
         Returns:
             None
         """
-        if self.game.is_cell_fixed(row, col):
-            messagebox.showwarning("⚠️ Advertencia", "Esta celda ya tiene un valor fijo")
+        if (self._fixed_mask >> (row * 9 + col)) & 1:
+            self._show_status("Esta celda ya tiene un valor fijo")
             return
 
         correct_value = self.game.use_help(row, col)
+        self._board_dirty = True
 
         if correct_value is not None:
-            self.cells[row][col].delete(0, tk.END)
-            self.cells[row][col].insert(0, str(correct_value))
-            self.cells[row][col].config(bg=self.colors['correct'])
-            self.help_label.config(text=str(self.game.helps_used))
+            self._set_cell_text(row, col, str(correct_value))
+            self._dirty_cells.discard(row * 9 + col)
+            self._set_cell_bg(row, col, self.colors['correct'])
+            self.help_var.set(str(self.game.helps_used))
+
+    def _color_by_status(self, cell_status: dict, statuses: Tuple[str, ...]):
+        """
+        Colorea las celdas del tablero agrupadas por estado
+
+        Marca cada rectángulo con una etiqueta del Canvas igual a su estado
+        y luego cambia el color de todas las celdas de un mismo estado con
+        una sola llamada a itemconfigure por etiqueta. Al final fuerza un
+        único redibujado para que los colores se vean antes de que se abra
+        el diálogo de resumen.
+
+        Args:
+            cell_status (dict): Diccionario de check_all_cells()
+            statuses (Tuple[str, ...]): Estados a colorear; cada uno debe ser
+                también una clave de self.colors
+
+        Returns:
+            None
+        """
+        canvas = self.board_canvas
+
+        # Pintar ya los cambios pendientes para que no tapen los nuevos colores
+        self._flush_dirty()
+
+        # Limpiar las etiquetas de la verificación anterior
+        for status in ('correct', 'incorrect', 'empty'):
+            canvas.dtag('all', status)
+
+        fixed_mask = self._fixed_mask
+        cell_rects = self.cell_rects
+
+        for status in statuses:
+            for row, col in cell_status[status]:
+                idx = row * 9 + col
+                if status == 'correct' and (fixed_mask >> idx) & 1:
+                    continue
+                canvas.addtag_withtag(status, cell_rects[idx])
+
+        for status in statuses:
+            canvas.itemconfigure(status, fill=self.colors[status])
+
+        # Dibujar todos los cambios de una vez, antes de cualquier diálogo
+        self.master.update_idletasks()
+
+    def _get_cell_status(self) -> dict:
+        """
+        Obtiene el estado de todas las celdas, recalculándolo solo si hace falta
+
+        El resultado de check_all_cells() se guarda y se reutiliza mientras
+        el tablero no haya cambiado (por ejemplo, al verificar y luego
+        finalizar sin editar ninguna celda).
+
+        Args:
+            Ninguno
+
+        Returns:
+            dict: Diccionario de check_all_cells() para el tablero actual
+        """
+        if self._board_dirty:
+            self._cached_status = self.game.check_all_cells()
+            self._board_dirty = False
+        return self._cached_status
 
     def _verify_board(self):
         """
@@ -673,29 +1286,17 @@ class SudokuGUI:
         Returns:
             None
         """
-        cell_status = self.game.check_all_cells()
+        cell_status = self._get_cell_status()
 
         # Colorear celdas según su estado
-        for row, col in cell_status['correct']:
-            if not self.game.is_cell_fixed(row, col):
-                self.cells[row][col].config(bg=self.colors['correct'])
-
-        for row, col in cell_status['incorrect']:
-            self.cells[row][col].config(bg=self.colors['incorrect'])
-
-        for row, col in cell_status['empty']:
-            self.cells[row][col].config(bg=self.colors['empty'])
+        self._color_by_status(cell_status, ('correct', 'incorrect', 'empty'))
 
         # Mostrar resumen
-        correct_count = len(cell_status['correct'])
-        incorrect_count = len(cell_status['incorrect'])
-        empty_count = len(cell_status['empty'])
+        message = VERIFY_TEMPLATE.format(correct=len(cell_status['correct']),
+                                         incorrect=len(cell_status['incorrect']),
+                                         empty=len(cell_status['empty']))
 
-        message = f"✅ Correctas: {correct_count}\n"
-        message += f"❌ Incorrectas: {incorrect_count}\n"
-        message += f"⬜ Vacías: {empty_count}"
-
-        messagebox.showinfo("🔍 Verificación del Tablero", message)
+        self._modal(self._show_info, "🔍 Verificación del Tablero", message)
 
     def _finish_game(self):
         """
@@ -712,18 +1313,13 @@ class SudokuGUI:
             None
         """
         self.timer_running = False
-        result = self.game.finish_game()
+        result = self.game.finish_game(self._get_cell_status())
 
         # Guardar estadísticas en archivo txt
         filepath = self.game.save_statistics_to_file(result)
 
         # Colorear todas las celdas
-        for row, col in result['cell_status']['correct']:
-            if not self.game.is_cell_fixed(row, col):
-                self.cells[row][col].config(bg=self.colors['correct'])
-
-        for row, col in result['cell_status']['incorrect']:
-            self.cells[row][col].config(bg=self.colors['incorrect'])
+        self._color_by_status(result['cell_status'], ('correct', 'incorrect'))
 
         # Crear mensaje de resultado
         minutes = int(result['time'] // 60)
@@ -731,37 +1327,35 @@ class SudokuGUI:
 
         if result['correct']:
             title = "🎉 ¡FELICITACIONES!"
-            message = "¡Has completado el Sudoku correctamente!\n\n"
+            header = "¡Has completado el Sudoku correctamente!\n\n"
         else:
             title = "📊 Juego Finalizado"
-            message = "El Sudoku no está completamente correcto.\n\n"
-
-        message += f"⏱️ Tiempo: {minutes:02d}:{seconds:02d}\n"
-        message += f"🏆 Puntuación Final: {result['score']}\n\n"
-        message += f"📈 Detalles:\n"
-        message += f"  • Bonificación por tiempo: +{result['time_bonus']}\n"
-        message += f"  • Penalización por errores: -{result['error_penalty']}\n"
-        message += f"  • Penalización por ayudas: -{result['help_penalty']}\n\n"
-        message += f"📊 Estadísticas:\n"
-        message += f"  • Celdas correctas: {len(result['cell_status']['correct'])}\n"
-        message += f"  • Celdas incorrectas: {result['errors']}\n"
-        message += f"  • Celdas vacías: {result['empty']}\n"
-        message += f"  • Ayudas usadas: {result['helps']}\n\n"
+            header = "El Sudoku no está completamente correcto.\n\n"
+
+        body = FINISH_TEMPLATE.format_map({
+            **result,
+            'minutes': minutes,
+            'seconds': seconds,
+            'correct_cells': len(result['cell_status']['correct'])
+        })
 
         # Agregar información sobre guardado de estadísticas
         if filepath:
-            message += f"💾 Estadísticas guardadas en:\n{filepath}"
+            footer = f"💾 Estadísticas guardadas en:\n{filepath}"
         else:
-            message += "⚠️ No se pudieron guardar las estadísticas"
+            footer = "⚠️ No se pudieron guardar las estadísticas"
+
+        message = header + body + footer
 
-        messagebox.showinfo(title, message)
+        self._modal(self._show_info, title, message)
 
     def _new_game(self):
         """
         Inicia un nuevo juego
 
-        Pregunta al usuario si desea reiniciar, destruye la interfaz actual
-        y vuelve a la pantalla de selección de dificultad.
+        Pregunta al usuario si desea reiniciar, oculta la interfaz de juego
+        (sin destruirla, para reutilizarla en la siguiente partida) y vuelve
+        a la pantalla de selección de dificultad.
 
         Args:
             Ninguno
@@ -769,16 +1363,22 @@ class SudokuGUI:
         Returns:
             None
         """
-        if messagebox.askyesno("🔄 Nuevo Juego",
-                               "¿Estás seguro de que quieres iniciar un nuevo juego?\n"
-                               "Se perderá el progreso actual."):
-            # Destruir widgets actuales
-            for widget in self.master.winfo_children():
-                widget.destroy()
+        if self._modal(messagebox.askyesno, "🔄 Nuevo Juego",
+                       "¿Estás seguro de que quieres iniciar un nuevo juego?\n"
+                       "Se perderá el progreso actual."):
+            # Ocultar la interfaz de juego y detener el temporizador
+            self.game_frame.pack_forget()
+            if self._timer_job is not None:
+                self.master.after_cancel(self._timer_job)
+                self._timer_job = None
 
             # Reiniciar variables
             self.game = None
-            self.cells = []
+            self._fixed_mask = 0
+            self._default_fill = []
+            self._dirty_cells.clear()
+            self._board_dirty = True
+            self._cached_status = None
             self.selected_cell = None
             self.help_mode = False
             self.timer_running = False
@@ -786,6 +1386,36 @@ class SudokuGUI:
             # Mostrar pantalla de inicio
             self._show_start_screen()
 
+    def _modal(self, dialog, *args, **kwargs):
+        """
+        Muestra un diálogo modal con el temporizador en pausa
+
+        Mientras el diálogo está abierto no se procesan los tics del
+        temporizador, así que se cancela el tic pendiente y se vuelve a
+        iniciar al cerrarlo (solo si estaba corriendo). El tiempo de juego
+        no se detiene: se sigue midiendo desde el inicio de la partida.
+
+        Args:
+            dialog (Callable): Función que muestra el diálogo (_show_info o
+                una función de messagebox)
+            *args: Argumentos posicionales para el diálogo
+            **kwargs: Argumentos con nombre para el diálogo
+
+        Returns:
+            Any: Valor devuelto por el diálogo
+        """
+        resume = self.timer_running
+        self.timer_running = False
+        if self._timer_job is not None:
+            self.master.after_cancel(self._timer_job)
+            self._timer_job = None
+
+        try:
+            return dialog(*args, **kwargs)
+        finally:
+            if resume:
+                self._start_timer()
+
     def _start_timer(self):
         """
         Inicia el temporizador
@@ -800,14 +1430,17 @@ class SudokuGUI:
             None
         """
         self.timer_running = True
+        self._last_timer_text = None
         self._update_timer()
 
     def _update_timer(self):
         """
         Actualiza el temporizador cada segundo
 
-        Método recursivo que se llama a sí mismo cada 1000ms para
-        actualizar el tiempo transcurrido en formato MM:SS.
+        Método recursivo que se vuelve a programar justo para el siguiente
+        cambio de segundo del tiempo transcurrido, y solo modifica la
+        etiqueta (formato MM:SS) cuando el texto mostrado cambia. Mientras
+        hay un diálogo abierto no hay tics: _modal cancela el pendiente.
 
         Args:
             Ninguno
@@ -819,7 +1452,12 @@ class SudokuGUI:
             elapsed = self.game.get_elapsed_time()
             minutes = int(elapsed // 60)
             seconds = int(elapsed % 60)
-            self.timer_label.config(text=f"{minutes:02d}:{seconds:02d}")
+            text = f"{minutes:02d}:{seconds:02d}"
+
+            if text != self._last_timer_text:
+                self.timer_var.set(text)
+                self._last_timer_text = text
 
-            # Continuar actualizando
-            self.master.after(1000, self._update_timer)
+            # Continuar actualizando al inicio del siguiente segundo
+            delay = 1000 - int(elapsed * 1000) % 1000
+            self._timer_job = self.master.after(delay, self._update_timer)
@@ -0,0 +1,185 @@
+"""
+Núcleos opcionales compilados con Numba para el juego y el generador de Sudoku
+
+Numba y NumPy no son dependencias obligatorias del proyecto. Si no están
+instalados, NUMBA_AVAILABLE es False y el resto del código utiliza sus
+implementaciones en Python puro.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMBA_AVAILABLE = False
+
+
+# Códigos de estado por celda producidos por classify_cells
+STATUS_FIXED = 0
+STATUS_CORRECT = 1
+STATUS_INCORRECT = 2
+STATUS_EMPTY = 3
+
+# Nombre de cada código de estado, en el orden de los códigos
+STATUS_NAMES = ('fixed', 'correct', 'incorrect', 'empty')
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def classify_cells(current, solution, puzzle, out):
+        """
+        Clasifica las 81 celdas del tablero en código compilado
+
+        Args:
+            current (np.ndarray): Tablero actual plano (uint8[81])
+            solution (np.ndarray): Solución plana (uint8[81])
+            puzzle (np.ndarray): Tablero inicial plano (uint8[81]); las
+                celdas distintas de cero son fijas
+            out (np.ndarray): Arreglo preasignado (uint8[81]) donde se
+                escribe el código de estado de cada celda
+
+        Returns:
+            Tuple[int, int, int, int]: Cantidad de celdas correctas,
+                incorrectas, vacías y fijas
+        """
+        correct = 0
+        incorrect = 0
+        empty = 0
+        fixed = 0
+
+        for idx in range(81):
+            if puzzle[idx] != 0:
+                out[idx] = STATUS_FIXED
+                fixed += 1
+            elif current[idx] == 0:
+                out[idx] = STATUS_EMPTY
+                empty += 1
+            elif current[idx] == solution[idx]:
+                out[idx] = STATUS_CORRECT
+                correct += 1
+            else:
+                out[idx] = STATUS_INCORRECT
+                incorrect += 1
+
+        return correct, incorrect, empty, fixed
+
+    @njit(cache=True)
+    def _popcount9(mask):
+        """
+        Cuenta los bits encendidos de una máscara de candidatos
+
+        Args:
+            mask (int): Máscara de 9 bits
+
+        Returns:
+            int: Cantidad de bits encendidos
+        """
+        count = 0
+        while mask:
+            mask &= mask - 1
+            count += 1
+        return count
+
+    @njit(cache=True)
+    def fill_board(board, row_mask, col_mask, box_mask, seed):
+        """
+        Llena un tablero plano con backtracking iterativo y selección MRV
+
+        Versión compilada de SudokuGenerator._fill_board: elige siempre la
+        celda vacía con menos candidatos y prueba sus candidatos en orden
+        aleatorio, usando una pila explícita de (celda, candidatos restantes).
+        El orden aleatorio sale de un xorshift64 local (unos pocos
+        desplazamientos y XOR por número), sembrado desde Python.
+
+        Args:
+            board (np.ndarray): Tablero plano (int8[81]), modificado in-place
+            row_mask (np.ndarray): Máscaras de dígitos usados por fila (uint16[9])
+            col_mask (np.ndarray): Máscaras de dígitos usados por columna (uint16[9])
+            box_mask (np.ndarray): Máscaras de dígitos usados por subcuadro (uint16[9])
+            seed (int): Semilla distinta de cero para el xorshift64
+
+        Returns:
+            bool: True si se logró llenar todo el tablero, False si no hay solución
+        """
+        state = np.uint64(seed)
+        stack_cell = np.empty(81, dtype=np.int64)
+        stack_options = np.empty(81, dtype=np.int64)
+        depth = 0
+
+        while True:
+            # Selección MRV: celda vacía con menos candidatos
+            best = -1
+            best_count = 10
+            best_candidates = 0
+            for idx in range(81):
+                if board[idx] == 0:
+                    row = idx // 9
+                    col = idx % 9
+                    box = (row // 3) * 3 + col // 3
+                    candidates = ~(row_mask[row] | col_mask[col] | box_mask[box]) & 0x1FF
+                    count = _popcount9(candidates)
+                    if count < best_count:
+                        best = idx
+                        best_count = count
+                        best_candidates = candidates
+                        if count <= 1:
+                            break
+
+            if best < 0:
+                return True
+
+            stack_cell[depth] = best
+            stack_options[depth] = best_candidates
+            depth += 1
+
+            # Colocar el siguiente candidato disponible, retrocediendo si hace falta
+            placed = False
+            while depth > 0:
+                idx = stack_cell[depth - 1]
+                row = idx // 9
+                col = idx % 9
+                box = (row // 3) * 3 + col // 3
+
+                num = board[idx]
+                if num != 0:
+                    bit = 1 << (num - 1)
+                    board[idx] = 0
+                    row_mask[row] ^= bit
+                    col_mask[col] ^= bit
+                    box_mask[box] ^= bit
+
+                options = stack_options[depth - 1]
+                if options != 0:
+                    # Avanzar el xorshift64 y elegir al azar uno de los bits encendidos
+                    state ^= state << np.uint64(13)
+                    state ^= state >> np.uint64(7)
+                    state ^= state << np.uint64(17)
+                    skip = np.int64((state & np.uint64(0xFFFFFFFF)) % np.uint64(_popcount9(options)))
+
+                    options_left = options
+                    for _ in range(skip):
+                        options_left &= options_left - 1
+                    bit = options_left & -options_left
+
+                    num = 1
+                    while (bit >> num) != 0:
+                        num += 1
+
+                    stack_options[depth - 1] = options & ~bit
+                    board[idx] = num
+                    row_mask[row] |= bit
+                    col_mask[col] |= bit
+                    box_mask[box] |= bit
+                    placed = True
+                    break
+
+                depth -= 1
+
+            if not placed:
+                return False
+
+else:
+    classify_cells = None
+    fill_board = None